@@ -79,7 +79,7 @@ def _(Concrete, np, plt):
     M20 = Concrete(fck=20)
 
     _x = np.concatenate([np.linspace(0, 0.002, 51), np.array([0.003, 0.0035])])
-    _y = np.array([M20.fc(_xx) for _xx in _x])
+    _y = M20.fc(_x)
 
     _fig, _ax = plt.subplots(figsize=(8, 4))
     _ax.plot(_x, _y)
@@ -115,7 +115,7 @@ def _(F, RebarMS, np, plt):
     MS250 = RebarMS(fy=_fy)
     _fsy = F(100, 115) * _fy / Es
     _x = np.array([0.0, 0.5 * _fsy, _fsy, 1.5 * _fsy, 2.5 * _fsy])
-    _y = np.array([MS250.fs(_xx) for _xx in _x])
+    _y = MS250.fs(_x)
 
     _fig, _ax = plt.subplots(figsize=(8, 4))
     _ax.plot(_x, _y)
@@ -160,7 +160,7 @@ def _(Es, F, RebarHYSD, np, plt):
     _x = _y / Es + _ep_fs[:, 0]
     _x1 = np.array([_x[-1] + 0.001, _x[-1] + 0.002, _x[-1] + 0.003])
     _x = np.concatenate([_x, _x1])
-    _y = np.array([Fe500.fs(_xx) for _xx in _x])
+    _y = Fe500.fs(_x)
 
     _fig, _ax = plt.subplots(figsize=(8, 4))
     _ax.plot(_x, _y)
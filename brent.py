@@ -1,7 +1,96 @@
+import math
+import time
+from dataclasses import dataclass, field
 from typing import Callable
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
-def find_bracket(f: Callable, x_start: float, x_end: float, n: int = 10, **kwargs):
+
+@dataclass
+class SolverStats:
+    """
+    Statistics recorded by the solvers in this module when an instance is
+    passed as the stats argument. Counts and times accumulate, so a single
+    instance can follow a complete solve, e.g. find_bracket() followed by
+    brent_root(). When stats is None nothing is recorded and f is called
+    directly.
+
+    Attributes
+    ----------
+    nfev : int
+        Number of calls to the objective function. Batch solvers count one
+        call per array evaluation.
+    ndev : int
+        Number of calls to derivatives of the objective function.
+    niter : int
+        Number of iterations performed.
+    widths : list of float
+        Bracket width after each iteration. Batch solvers record the largest
+        width among the brackets that have not yet converged. Solvers for
+        systems of equations record the largest residual.
+    reason : str
+        Why the most recent solver stopped: "root" (f is exactly zero),
+        "xtol" (bracket narrower than the tolerance), "ftol" (|f| smaller
+        than the tolerance), "bracket" (a bracket was found),
+        "bound" (the solution lies on a bound of the unknowns), or
+        "no_bracket", "singular" or "max_iter" when the solver failed.
+    elapsed : float
+        Wall time in seconds spent in the solvers.
+    """
+
+    nfev: int = 0
+    ndev: int = 0
+    niter: int = 0
+    widths: list[float] = field(default_factory=list)
+    reason: str = ""
+    elapsed: float = 0.0
+    _t0: float = field(default=0.0, repr=False)
+
+    def start(self, f: Callable) -> Callable:
+        """Start the clock and return f wrapped to count its calls"""
+        self._t0 = time.perf_counter()
+
+        def counted(x, **kwargs):
+            self.nfev += 1
+            return f(x, **kwargs)
+
+        return counted
+
+    def derivative(self, fd: Callable) -> Callable:
+        """Return the derivative fd wrapped to count its calls"""
+
+        def counted(x, **kwargs):
+            self.ndev += 1
+            return fd(x, **kwargs)
+
+        return counted
+
+    def step(self, width: float) -> None:
+        self.niter += 1
+        self.widths.append(float(width))
+
+    def stop(self, reason: str) -> None:
+        self.reason = reason
+        self.elapsed += time.perf_counter() - self._t0
+
+
+def _stop(stats: SolverStats | None, reason: str, result=None):
+    """Record why a solver stopped, if stats are being collected, and pass
+    result through"""
+    if stats is not None:
+        stats.stop(reason)
+    return result
+
+
+def find_bracket(
+    f: Callable,
+    x_start: float,
+    x_end: float,
+    n: int = 10,
+    stats: SolverStats | None = None,
+    **kwargs,
+):
     """
     Find x1, x2 that bracket a root of f(x) in [x_start, x_end] by dividing
     the interval into n equal parts and scanning for a sign change.
@@ -14,6 +103,8 @@ def find_bracket(f: Callable, x_start: float, x_end: float, n: int = 10, **kwarg
         Interval endpoints with x_start < x_end.
     n : int
         Number of equal divisions of the interval.
+    stats : SolverStats, optional
+        Statistics object to record the evaluations and wall time.
     **kwargs :
         Additional keyword arguments passed to f.
 
@@ -27,33 +118,163 @@ def find_bracket(f: Callable, x_start: float, x_end: float, n: int = 10, **kwarg
     if n <= 0:
         raise ValueError("n must be a positive integer")
 
+    if stats is not None:
+        f = stats.start(f)
+
     dx = (x_end - x_start) / n
 
     x_prev = x_start
     f_prev = f(x_prev, **kwargs)
 
     if f_prev == 0:
-        return x_prev, x_prev
+        return _stop(stats, "root", (x_prev, x_prev))
 
     for i in range(1, n + 1):
         x_curr = x_start + i * dx
         f_curr = f(x_curr, **kwargs)
 
         if f_prev * f_curr < 0:
-            return x_prev, x_curr
+            return _stop(stats, "bracket", (x_prev, x_curr))
 
         if f_curr == 0:
-            return x_curr, x_curr
+            return _stop(stats, "root", (x_curr, x_curr))
 
         x_prev, f_prev = x_curr, f_curr
 
+    _stop(stats, "no_bracket")
     raise ValueError(
         f"Error: find_bracket() could not determine brackets between [{x_start}, {x_end}] with {n} intervals"
     )
 
 
+def find_bracket_adaptive(
+    f: Callable,
+    x_start: float,
+    x_end: float,
+    n: int = 8,
+    monotonic: bool = False,
+    max_depth: int = 4,
+    stats: SolverStats | None = None,
+    **kwargs,
+):
+    """
+    Find x1, x2 that bracket a root of f(x) in [x_start, x_end] with far
+    fewer evaluations of f than the uniform scan of find_bracket().
+
+    If f is known to be monotonic in the interval, only the two endpoints
+    are evaluated and the whole interval is returned as the bracket.
+    Otherwise the interval is scanned coarsely with n divisions and, if no
+    sign change is found, each cell around a local minimum of |f| (where f
+    approaches zero without crossing it at the coarse spacing) is scanned
+    again with n divisions, up to max_depth levels of refinement.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) whose root is sought.
+    x_start, x_end : float
+        Interval endpoints with x_start < x_end.
+    n : int, optional
+        Number of equal divisions of the interval at each level (default: 8).
+    monotonic : bool, optional
+        True if the caller knows f is monotonic in [x_start, x_end]
+        (default: False).
+    max_depth : int, optional
+        Maximum number of refinement levels (default: 4).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations and wall time.
+    **kwargs :
+        Additional keyword arguments passed to f.
+
+    Returns
+    -------
+    (x1, x2) : tuple of floats
+        A pair such that f(x1) and f(x2) have opposite signs, or x1 == x2
+        if f(x1) is exactly zero. Where there is more than one root, the
+        bracket returned by the coarsest scan that finds a sign change is
+        the one nearest x_start.
+    """
+
+    if n <= 0:
+        raise ValueError("n must be a positive integer")
+
+    if stats is not None:
+        f = stats.start(f)
+
+    f_start = f(x_start, **kwargs)
+    if f_start == 0:
+        return _stop(stats, "root", (x_start, x_start))
+    f_end = f(x_end, **kwargs)
+    if f_end == 0:
+        return _stop(stats, "root", (x_end, x_end))
+
+    if monotonic:
+        if f_start * f_end < 0:
+            return _stop(stats, "bracket", (x_start, x_end))
+        _stop(stats, "no_bracket")
+        raise ValueError(
+            f"Error: find_bracket_adaptive() monotonic function has no root between [{x_start}, {x_end}]"
+        )
+
+    bracket = _scan_refine(f, x_start, f_start, x_end, f_end, n, max_depth, kwargs)
+    if bracket is None:
+        _stop(stats, "no_bracket")
+        raise ValueError(
+            f"Error: find_bracket_adaptive() could not determine brackets between [{x_start}, {x_end}] with {n} intervals and {max_depth} refinements"
+        )
+    return _stop(stats, "root" if bracket[0] == bracket[1] else "bracket", bracket)
+
+
+def _scan_refine(
+    f: Callable,
+    x1: float,
+    f1: float,
+    x2: float,
+    f2: float,
+    n: int,
+    depth: int,
+    kwargs: dict,
+) -> tuple[float, float] | None:
+    """Scan [x1, x2] with n divisions reusing the known values f1 and f2 at
+    the ends, then recursively refine around local minima of |f|. Returns
+    None if no bracket is found."""
+    dx = (x2 - x1) / n
+    xs, fs = [x1], [f1]
+    for i in range(1, n + 1):
+        x_curr = x2 if i == n else x1 + i * dx
+        f_curr = f2 if i == n else f(x_curr, **kwargs)
+
+        if fs[-1] * f_curr < 0:
+            return xs[-1], x_curr
+        if f_curr == 0:
+            return x_curr, x_curr
+
+        xs.append(x_curr)
+        fs.append(f_curr)
+
+    if depth <= 0:
+        return None
+
+    for i in range(1, n):
+        if abs(fs[i]) <= abs(fs[i - 1]) and abs(fs[i]) <= abs(fs[i + 1]):
+            bracket = _scan_refine(
+                f, xs[i - 1], fs[i - 1], xs[i + 1], fs[i + 1], n, depth - 1, kwargs
+            )
+            if bracket is not None:
+                return bracket
+    return None
+
+
 def brent_root(
-    f: Callable, x1: float, x2: float, max_iter: int = 30, tol: float = 1e-12, **kwargs
+    f: Callable,
+    x1: float,
+    x2: float,
+    max_iter: int = 30,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    f1: float | None = None,
+    f2: float | None = None,
+    **kwargs,
 ) -> float:
     """
     Find a root of f(x) in the bracket [x1, x2] using Brent's method.
@@ -68,6 +289,11 @@ def brent_root(
         Maximum number of iterations (default: 30).
     tol : float, optional
         Convergence tolerance (default: 1e-12).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    f1, f2 : float, optional
+        Values of f(x1) and f(x2), if already known, to avoid evaluating
+        them again.
     **kwargs :
         Additional keyword arguments passed to f.
 
@@ -77,16 +303,22 @@ def brent_root(
         The root if found, otherwise None.
     """
 
-    f1 = f(x1, **kwargs)
-    f2 = f(x2, **kwargs)
+    if stats is not None:
+        f = stats.start(f)
+
+    if f1 is None:
+        f1 = f(x1, **kwargs)
+    if f2 is None:
+        f2 = f(x2, **kwargs)
 
     if f1 == 0:
-        return x1
+        return _stop(stats, "root", x1)
     if f2 == 0:
-        return x2
+        return _stop(stats, "root", x2)
 
     if f1 * f2 > 0:
         # No bracket
+        _stop(stats, "no_bracket")
         raise ValueError(
             f"Error: bisection() interval {x1} and {x2} does not bracket the roots"
         )
@@ -101,21 +333,23 @@ def brent_root(
     for _ in range(max_iter):
         # print(f"=== {_}")
         if fb == 0:
-            return b
+            return _stop(stats, "root", b)
 
         # Ensure |fb| <= |fa|
         if abs(fc) < abs(fb):
-            a, b, c = b, c, a
-            fa, fb, fc = fb, fc, fa
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
 
         tol_act = 2 * tol * max(abs(b), 1.0)
         m = 0.5 * (c - b)
         # print("+++", a, b, c, fa, fb, fc, m, tol_act)
+        if stats is not None:
+            stats.step(abs(c - b))
 
         # Convergence check
         if abs(m) <= tol_act:
             # print("111", m, b)
-            return b
+            return _stop(stats, "xtol", b)
 
         # Decide whether to use interpolation or bisection
         if abs(e) >= tol_act and abs(fa) > abs(fb):
@@ -163,15 +397,251 @@ def brent_root(
         # Update c if needed
         if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
             c, fc = a, fa
+            d = e = b - a
 
     # Failed to converge
+    _stop(stats, "max_iter")
     raise ValueError(
         f"Error: brent_root() did not converge after {max_iter} iterations"
     )
 
 
+def brent_root_batch(
+    f: Callable,
+    x1: ArrayLike,
+    x2: ArrayLike,
+    max_iter: int = 30,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    **kwargs,
+) -> NDArray[np.float64]:
+    """
+    Find the roots of many independent problems f(x) = 0 in the brackets
+    [x1[i], x2[i]] simultaneously, using Brent's method in lockstep.
+
+    Every iteration performs the same steps as brent_root() on all brackets
+    at once, with boolean masks selecting between interpolation and
+    bisection and freezing the brackets that have already converged.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) that accepts an array x and returns an array
+        of the same shape, one value per problem.
+    x1, x2 : array_like
+        Initial brackets such that f(x1) and f(x2) have opposite signs
+        elementwise. Scalars are broadcast against arrays.
+    max_iter : int, optional
+        Maximum number of iterations (default: 30).
+    tol : float, optional
+        Convergence tolerance (default: 1e-12).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    **kwargs :
+        Additional keyword arguments passed unchanged to f. They may be
+        arrays broadcastable against x, one value per problem.
+
+    Returns
+    -------
+    ndarray
+        The roots, with the broadcast shape of x1 and x2.
+    """
+
+    a, b = np.broadcast_arrays(np.asarray(x1, dtype=float), np.asarray(x2, dtype=float))
+    a, b = a.copy(), b.copy()
+    if stats is not None:
+        f = stats.start(f)
+    fa = np.asarray(f(a, **kwargs), dtype=float)
+    fb = np.asarray(f(b, **kwargs), dtype=float)
+
+    if np.any(fa * fb > 0):
+        # No bracket
+        i = np.flatnonzero(fa * fb > 0)[0]
+        _stop(stats, "no_bracket")
+        raise ValueError(
+            f"Error: brent_root_batch() interval {a.flat[i]} and {b.flat[i]} does not bracket the roots"
+        )
+
+    # A root at x1 is carried in b so that b always holds the current estimate
+    b = np.where(fa == 0, a, b)
+    fb = np.where(fa == 0, 0.0, fb)
+    c, fc = a.copy(), fa.copy()
+    d = b - a
+    e = d.copy()
+    done = np.zeros(b.shape, dtype=bool)
+
+    for _ in range(max_iter):
+        done |= fb == 0
+
+        # Ensure |fb| <= |fa|
+        swap = ~done & (np.abs(fc) < np.abs(fb))
+        a, fa = np.where(swap, b, a), np.where(swap, fb, fa)
+        b, fb = np.where(swap, c, b), np.where(swap, fc, fb)
+        c, fc = np.where(swap, a, c), np.where(swap, fa, fc)
+
+        tol_act = 2 * tol * np.maximum(np.abs(b), 1.0)
+        m = 0.5 * (c - b)
+
+        # Convergence check
+        done |= np.abs(m) <= tol_act
+        if done.all():
+            return _stop(stats, "xtol", b)
+        active = ~done
+        if stats is not None:
+            stats.step(np.abs(c - b)[active].max())
+
+        # Inverse quadratic interpolation or secant, computed for all lanes
+        # and accepted only where the scalar algorithm would accept it
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = fb / fa
+            secant = a == c
+            qq = fa / fc
+            r = fb / fc
+            p = np.where(
+                secant, 2 * m * s, s * (2 * m * qq * (qq - r) - (b - a) * (r - 1))
+            )
+            q = np.where(secant, 1 - s, (qq - 1) * (r - 1) * (s - 1))
+            q = np.where(p > 0, -q, q)
+            p = np.abs(p)
+            accept = (
+                active
+                & (np.abs(e) >= tol_act)
+                & (np.abs(fa) > np.abs(fb))
+                & (2 * p < np.minimum(3 * m * q - np.abs(tol_act * q), np.abs(e * q)))
+            )
+            e = np.where(accept, d, m)
+            d = np.where(accept, p / q, m)
+
+        # Move a → b
+        a = np.where(active, b, a)
+        fa = np.where(active, fb, fa)
+
+        # Step
+        step = np.where(np.abs(d) > tol_act, d, np.where(m > 0, tol_act, -tol_act))
+        b = np.where(active, b + step, b)
+        fb = np.where(active, np.asarray(f(b, **kwargs), dtype=float), fb)
+
+        # Update c if needed
+        reset = active & (((fb > 0) & (fc > 0)) | ((fb < 0) & (fc < 0)))
+        c, fc = np.where(reset, a, c), np.where(reset, fa, fc)
+        d = np.where(reset, b - a, d)
+        e = np.where(reset, b - a, e)
+
+    # Failed to converge
+    _stop(stats, "max_iter")
+    raise ValueError(
+        f"Error: brent_root_batch() {np.count_nonzero(~done)} of {done.size} roots did not converge after {max_iter} iterations"
+    )
+
+
+def find_all_brackets(
+    f: Callable,
+    x_start: float,
+    x_end: float,
+    n: int = 100,
+    stats: SolverStats | None = None,
+    **kwargs,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Find every bracket of a root of f(x) in [x_start, x_end] by evaluating f
+    once on a grid of n equal divisions of the interval and locating all
+    the sign changes.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) that accepts an array x and returns an array
+        of the same shape. Wrap a function of a scalar with np.vectorize().
+    x_start, x_end : float
+        Interval endpoints with x_start < x_end.
+    n : int, optional
+        Number of equal divisions of the interval (default: 100).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations and wall time.
+    **kwargs :
+        Additional keyword arguments passed to f.
+
+    Returns
+    -------
+    (x1, x2) : tuple of ndarrays
+        Brackets in increasing order of x, such that f(x1[i]) and f(x2[i])
+        have opposite signs, or x1[i] == x2[i] where f(x1[i]) is exactly
+        zero. The arrays are empty if no bracket is found.
+    """
+
+    if n <= 0:
+        raise ValueError("n must be a positive integer")
+    if stats is not None:
+        f = stats.start(f)
+
+    x = np.linspace(x_start, x_end, n + 1)
+    y = np.asarray(f(x, **kwargs), dtype=float)
+
+    change = np.flatnonzero(y[:-1] * y[1:] < 0)
+    zero = np.flatnonzero(y == 0)
+    x1 = np.concatenate((x[change], x[zero]))
+    x2 = np.concatenate((x[change + 1], x[zero]))
+    order = np.argsort(x1, kind="stable")
+    return _stop(stats, "bracket" if x1.size else "no_bracket", (x1[order], x2[order]))
+
+
+def find_all_roots(
+    f: Callable,
+    x_start: float,
+    x_end: float,
+    n: int = 100,
+    max_iter: int = 30,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    **kwargs,
+) -> NDArray[np.float64]:
+    """
+    Find every root of f(x) in [x_start, x_end] that is separated from its
+    neighbours by at least one grid division. The brackets found by
+    find_all_brackets() are refined together with brent_root_batch().
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) that accepts an array x and returns an array
+        of the same shape. Wrap a function of a scalar with np.vectorize().
+    x_start, x_end : float
+        Interval endpoints with x_start < x_end.
+    n : int, optional
+        Number of equal divisions of the interval (default: 100).
+    max_iter : int, optional
+        Maximum number of iterations (default: 30).
+    tol : float, optional
+        Convergence tolerance (default: 1e-12).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    **kwargs :
+        Additional keyword arguments passed to f. Arrays must broadcast
+        against the array of brackets, so in practice they are scalars.
+
+    Returns
+    -------
+    ndarray
+        The roots in increasing order, empty if there are none.
+    """
+
+    x1, x2 = find_all_brackets(f, x_start, x_end, n, stats=stats, **kwargs)
+    if x1.size == 0:
+        return x1
+    return brent_root_batch(f, x1, x2, max_iter, tol, stats=stats, **kwargs)
+
+
 def bisection(
-    f: Callable, x1: float, x2: float, max_iter: int = 30, tol: float = 1e-12, **kwargs
+    f: Callable,
+    x1: float,
+    x2: float,
+    max_iter: int = 30,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    f1: float | None = None,
+    f2: float | None = None,
+    xtol: float | None = None,
+    **kwargs,
 ) -> float:
     """
     Find a root of f(x) in the bracket [x1, x2] using the bisection method.
@@ -185,21 +655,35 @@ def bisection(
     max_iter : int, optional
         Maximum number of iterations (default: 30).
     tol : float, optional
-        Convergence tolerance (default: 1e-12).
+        Convergence tolerance on |f| (default: 1e-12).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    f1, f2 : float, optional
+        Values of f(x1) and f(x2), if already known, to avoid evaluating
+        them again.
+    xtol : float, optional
+        Relative convergence tolerance on the width of the bracket, as for
+        the other methods. If None (default), only tol is used.
     **kwargs :
         Additional keyword arguments passed to f."""
 
-    f1 = f(x1, **kwargs)
-    f2 = f(x2, **kwargs)
+    if stats is not None:
+        f = stats.start(f)
+
+    if f1 is None:
+        f1 = f(x1, **kwargs)
+    if f2 is None:
+        f2 = f(x2, **kwargs)
     # print(f"Bisection start: x1={x1}, x2={x2}, f1={f1}, f2={f2}")
 
     if f1 == 0:
-        return x1
+        return _stop(stats, "root", x1)
     if f2 == 0:
-        return x2
+        return _stop(stats, "root", x2)
 
     if f1 * f2 > 0:
         # No bracket
+        _stop(stats, "no_bracket")
         raise ValueError(
             f"Error: bisection() interval {x1} and {x2} does not bracket the roots"
         )
@@ -209,18 +693,635 @@ def bisection(
         fm = f(xm, **kwargs)
 
         if abs(fm) < tol:
-            return xm
+            return _stop(stats, "ftol", xm)
 
         if f1 * fm < 0:
             x2, f2 = xm, fm
         else:
             x1, f1 = xm, fm
+        if stats is not None:
+            stats.step(abs(x2 - x1))
+
+        if xtol is not None and abs(x2 - x1) <= 2 * xtol * max(abs(xm), 1.0):
+            return _stop(stats, "xtol", 0.5 * (x1 + x2))
 
     # print("Failed to converge in bisection")
     # Failed to converge
+    _stop(stats, "max_iter")
     raise ValueError(f"Error: bisection() did not converge after {max_iter} iterations")
 
 
+def chandrupatla(
+    f: Callable,
+    x1: float,
+    x2: float,
+    max_iter: int = 50,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    f1: float | None = None,
+    f2: float | None = None,
+    **kwargs,
+) -> float:
+    """
+    Find a root of f(x) in the bracket [x1, x2] using Chandrupatla's method.
+
+    Each iteration evaluates f once, at a point chosen by inverse quadratic
+    interpolation through the last three points when the data indicate the
+    interpolant is monotonic in the bracket, and by bisection otherwise.
+    It needs fewer evaluations than Brent's method on smooth functions.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) whose root is sought.
+    x1, x2 : float
+        Initial bracket such that f(x1) and f(x2) have opposite signs.
+    max_iter : int, optional
+        Maximum number of iterations (default: 50).
+    tol : float, optional
+        Convergence tolerance (default: 1e-12).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    f1, f2 : float, optional
+        Values of f(x1) and f(x2), if already known, to avoid evaluating
+        them again.
+    **kwargs :
+        Additional keyword arguments passed to f.
+
+    Returns
+    -------
+    float
+        The root.
+    """
+
+    if stats is not None:
+        f = stats.start(f)
+
+    if f1 is None:
+        f1 = f(x1, **kwargs)
+    if f2 is None:
+        f2 = f(x2, **kwargs)
+
+    if f1 == 0:
+        return _stop(stats, "root", x1)
+    if f2 == 0:
+        return _stop(stats, "root", x2)
+
+    if f1 * f2 > 0:
+        # No bracket
+        _stop(stats, "no_bracket")
+        raise ValueError(
+            f"Error: chandrupatla() interval {x1} and {x2} does not bracket the roots"
+        )
+
+    # a is the newest point, b the previous point on the other side of the
+    # root and c the point discarded from the bracket
+    a, fa = x2, f2
+    b, fb = x1, f1
+    c, fc = a, fa
+    t = 0.5
+
+    for _ in range(max_iter):
+        xt = a + t * (b - a)
+        ft = f(xt, **kwargs)
+
+        if (ft > 0) == (fa > 0):
+            c, fc = a, fa
+        else:
+            c, fc = b, fb
+            b, fb = a, fa
+        a, fa = xt, ft
+
+        # Best estimate
+        if abs(fa) < abs(fb):
+            xm, fm = a, fa
+        else:
+            xm, fm = b, fb
+        if stats is not None:
+            stats.step(abs(b - a))
+
+        if fm == 0:
+            return _stop(stats, "root", xm)
+
+        tol_act = 2 * tol * max(abs(xm), 1.0)
+        tlim = tol_act / abs(b - a)
+        if tlim > 0.5:
+            return _stop(stats, "xtol", xm)
+
+        # Inverse quadratic interpolation is used only if it is monotonic
+        xi = (a - b) / (c - b)
+        phi = (fa - fb) / (fc - fb)
+        if phi**2 < xi and (1 - phi) ** 2 < 1 - xi:
+            t = fa / (fb - fa) * fc / (fb - fc) + (c - a) / (b - a) * fa / (
+                fc - fa
+            ) * fb / (fc - fb)
+        else:
+            t = 0.5
+        t = min(1 - tlim, max(tlim, t))
+
+    # Failed to converge
+    _stop(stats, "max_iter")
+    raise ValueError(
+        f"Error: chandrupatla() did not converge after {max_iter} iterations"
+    )
+
+
+def itp(
+    f: Callable,
+    x1: float,
+    x2: float,
+    max_iter: int = 50,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    f1: float | None = None,
+    f2: float | None = None,
+    k1: float | None = None,
+    k2: float = 2.0,
+    n0: int = 1,
+    **kwargs,
+) -> float:
+    """
+    Find a root of f(x) in the bracket [x1, x2] using the ITP (Interpolate,
+    Truncate and Project) method of Oliveira and Takahashi.
+
+    The regula falsi estimate is truncated towards the midpoint and then
+    projected into a neighbourhood of the midpoint, so the method never
+    needs more than n0 iterations more than bisection, while converging
+    superlinearly on smooth functions.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) whose root is sought.
+    x1, x2 : float
+        Initial bracket such that f(x1) and f(x2) have opposite signs.
+    max_iter : int, optional
+        Maximum number of iterations (default: 50).
+    tol : float, optional
+        Convergence tolerance (default: 1e-12).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    f1, f2 : float, optional
+        Values of f(x1) and f(x2), if already known, to avoid evaluating
+        them again.
+    k1, k2 : float, optional
+        Truncation parameters, k1 > 0 and 1 <= k2 < 2.618 (default:
+        k1 = 0.2 / (x2 - x1), k2 = 2).
+    n0 : int, optional
+        Slack in the number of iterations over bisection (default: 1).
+    **kwargs :
+        Additional keyword arguments passed to f.
+
+    Returns
+    -------
+    float
+        The root.
+    """
+
+    if stats is not None:
+        f = stats.start(f)
+
+    if x1 > x2:
+        x1, x2 = x2, x1
+        f1, f2 = f2, f1
+    if f1 is None:
+        f1 = f(x1, **kwargs)
+    if f2 is None:
+        f2 = f(x2, **kwargs)
+
+    if f1 == 0:
+        return _stop(stats, "root", x1)
+    if f2 == 0:
+        return _stop(stats, "root", x2)
+
+    if f1 * f2 > 0:
+        # No bracket
+        _stop(stats, "no_bracket")
+        raise ValueError(
+            f"Error: itp() interval {x1} and {x2} does not bracket the roots"
+        )
+
+    # The method is written for f(a) < 0 < f(b)
+    sign = 1.0 if f1 < 0 else -1.0
+    a, fa = x1, sign * f1
+    b, fb = x2, sign * f2
+
+    if k1 is None:
+        k1 = 0.2 / (b - a)
+    eps = tol * max(abs(a), abs(b), 1.0)
+    n_max = math.ceil(math.log2(max((b - a) / (2 * eps), 1.0))) + n0
+
+    for j in range(max_iter):
+        if b - a <= 2 * eps:
+            return _stop(stats, "xtol", 0.5 * (a + b))
+
+        x_half = 0.5 * (a + b)
+        r = eps * 2 ** (n_max - j) - 0.5 * (b - a)
+        delta = k1 * (b - a) ** k2
+
+        # Interpolate
+        x_f = (fb * a - fa * b) / (fb - fa)
+        # Truncate
+        sigma = math.copysign(1.0, x_half - x_f)
+        x_t = x_f + sigma * delta if delta <= abs(x_half - x_f) else x_half
+        # Project
+        x_itp = x_t if abs(x_t - x_half) <= r else x_half - sigma * r
+
+        f_itp = sign * f(x_itp, **kwargs)
+        if f_itp > 0:
+            b, fb = x_itp, f_itp
+        elif f_itp < 0:
+            a, fa = x_itp, f_itp
+        else:
+            return _stop(stats, "root", x_itp)
+        if stats is not None:
+            stats.step(b - a)
+
+    if b - a <= 2 * eps:
+        return _stop(stats, "xtol", 0.5 * (a + b))
+
+    # Failed to converge
+    _stop(stats, "max_iter")
+    raise ValueError(f"Error: itp() did not converge after {max_iter} iterations")
+
+
+def newton_safe(
+    f: Callable,
+    x1: float,
+    x2: float,
+    fprime: Callable,
+    fprime2: Callable | None = None,
+    max_iter: int = 50,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    f1: float | None = None,
+    f2: float | None = None,
+    **kwargs,
+) -> float:
+    """
+    Find a root of f(x) in the bracket [x1, x2] using Newton's method, or
+    Halley's method if the second derivative is given, safeguarded by
+    bisection.
+
+    The bracket is narrowed after every evaluation. A bisection step is
+    taken instead whenever the Newton or Halley step would leave the
+    bracket or would not halve the previous step, so the method converges
+    for any continuous f and converges quadratically (cubically for
+    Halley) near a simple root.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) whose root is sought.
+    x1, x2 : float
+        Initial bracket such that f(x1) and f(x2) have opposite signs.
+    fprime : callable
+        First derivative fprime(x, **kwargs) of f.
+    fprime2 : callable, optional
+        Second derivative fprime2(x, **kwargs) of f. If given, Halley's
+        method is used.
+    max_iter : int, optional
+        Maximum number of iterations (default: 50).
+    tol : float, optional
+        Convergence tolerance (default: 1e-12).
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    f1, f2 : float, optional
+        Values of f(x1) and f(x2), if already known, to avoid evaluating
+        them again.
+    **kwargs :
+        Additional keyword arguments passed to f, fprime and fprime2.
+
+    Returns
+    -------
+    float
+        The root.
+    """
+
+    if stats is not None:
+        f = stats.start(f)
+        fprime = stats.derivative(fprime)
+        if fprime2 is not None:
+            fprime2 = stats.derivative(fprime2)
+
+    if f1 is None:
+        f1 = f(x1, **kwargs)
+    if f2 is None:
+        f2 = f(x2, **kwargs)
+
+    if f1 == 0:
+        return _stop(stats, "root", x1)
+    if f2 == 0:
+        return _stop(stats, "root", x2)
+
+    if f1 * f2 > 0:
+        # No bracket
+        _stop(stats, "no_bracket")
+        raise ValueError(
+            f"Error: newton_safe() interval {x1} and {x2} does not bracket the roots"
+        )
+
+    # Orient the bracket so that f(lo) < 0 < f(hi)
+    if f1 < 0:
+        lo, hi = x1, x2
+    else:
+        lo, hi = x2, x1
+
+    # Start from the end with the smaller |f|
+    x = x1 if abs(f1) < abs(f2) else x2
+    fx = f1 if abs(f1) < abs(f2) else f2
+    dx_old = dx = abs(x2 - x1)
+
+    for _ in range(max_iter):
+        dfx = fprime(x, **kwargs)
+        step = None
+        if dfx != 0:
+            step = fx / dfx
+            if fprime2 is not None:
+                denom = 1 - 0.5 * step * fprime2(x, **kwargs) / dfx
+                if denom != 0:
+                    step /= denom
+
+        x_new = None if step is None else x - step
+        if (
+            x_new is None
+            or (x_new - lo) * (x_new - hi) > 0  # Outside the bracket
+            or abs(2 * step) > abs(dx_old)  # Not converging fast enough
+        ):
+            # Bisection
+            dx_old = dx
+            dx = 0.5 * (hi - lo)
+            x = lo + dx
+        else:
+            dx_old = dx
+            dx = step
+            x = x_new
+        if stats is not None:
+            stats.step(abs(hi - lo))
+
+        tol_act = 2 * tol * max(abs(x), 1.0)
+        if abs(dx) <= tol_act:
+            return _stop(stats, "xtol", x)
+
+        fx = f(x, **kwargs)
+        if fx == 0:
+            return _stop(stats, "root", x)
+        if fx < 0:
+            lo = x
+        else:
+            hi = x
+
+    # Failed to converge
+    _stop(stats, "max_iter")
+    raise ValueError(
+        f"Error: newton_safe() did not converge after {max_iter} iterations"
+    )
+
+
+SOLVERS: dict[str, Callable] = {
+    "brent": brent_root,
+    "bisection": bisection,
+    "chandrupatla": chandrupatla,
+    "itp": itp,
+    "newton": newton_safe,
+}
+
+
+def solve(
+    f: Callable,
+    bracket: tuple[float, float],
+    method: str = "brent",
+    max_iter: int | None = None,
+    tol: float = 1e-12,
+    stats: SolverStats | None = None,
+    f1: float | None = None,
+    f2: float | None = None,
+    **kwargs,
+) -> float:
+    """
+    Find a root of f(x) in a bracket with the chosen method.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) whose root is sought.
+    bracket : tuple of floats
+        Bracket (x1, x2) such that f(x1) and f(x2) have opposite signs, such
+        as the one returned by find_bracket().
+    method : str, optional
+        One of "brent", "bisection", "chandrupatla", "itp" or "newton"
+        (default: "brent"). Method "newton" requires the keyword argument
+        fprime, and uses Halley's method if fprime2 is also given.
+    max_iter : int, optional
+        Maximum number of iterations (default: the default of the method).
+    tol : float, optional
+        Convergence tolerance on the width of the bracket (default: 1e-12).
+        It is passed to bisection() as xtol, with a default max_iter large
+        enough to reach it.
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    f1, f2 : float, optional
+        Values of f at the ends of the bracket, if already known, to avoid
+        evaluating them again.
+    **kwargs :
+        Additional keyword arguments passed to f.
+
+    Returns
+    -------
+    float
+        The root.
+    """
+
+    try:
+        solver = SOLVERS[method]
+    except KeyError:
+        raise ValueError(
+            f"Error: solve() unknown method {method!r}, expected one of {list(SOLVERS)}"
+        ) from None
+
+    x1, x2 = bracket
+    if x1 == x2:  # find_bracket() found f(x1) == 0
+        return x1
+    if max_iter is not None:
+        kwargs["max_iter"] = max_iter
+    if solver is bisection:
+        kwargs.setdefault("max_iter", 200)
+        return solver(f, x1, x2, tol=0.0, stats=stats, f1=f1, f2=f2, xtol=tol, **kwargs)
+    return solver(f, x1, x2, tol=tol, stats=stats, f1=f1, f2=f2, **kwargs)
+
+
+@dataclass
+class Continuation:
+    """
+    Solve f(x, **{param: p}) = 0 for a sequence of values p of a parameter,
+    starting each solve from the roots already found instead of from a
+    cold bracket.
+
+    The first solve brackets the root with find_bracket_adaptive() in
+    [x_start, x_end]. Later solves extrapolate linearly from the last two
+    roots, evaluate f at that guess and step outwards from it with
+    geometrically increasing steps until the sign of f changes. The values
+    of f at the ends of the bracket so found are passed on to the solver.
+    If no bracket is found near the guess, the cold search is used.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, **kwargs) whose root is sought.
+    x_start, x_end : float
+        Interval, x_start < x_end, within which the roots are sought.
+    param : str
+        Name of the keyword argument of f that is varied.
+    method : str, optional
+        Solver method passed to solve() (default: "brent").
+    tol : float, optional
+        Convergence tolerance passed to solve() (default: 1e-12).
+    max_iter : int, optional
+        Maximum number of iterations passed to solve() (default: the
+        default of the method).
+    monotonic : bool, optional
+        Passed to find_bracket_adaptive() for the cold searches (default:
+        False).
+    """
+
+    f: Callable
+    x_start: float
+    x_end: float
+    param: str
+    method: str = "brent"
+    tol: float = 1e-12
+    max_iter: int | None = None
+    monotonic: bool = False
+    values: list[float] = field(default_factory=list)
+    roots: list[float] = field(default_factory=list)
+
+    def guess(self, value: float) -> tuple[float, float] | None:
+        """Estimate of the root for the parameter value and the size of the
+        first step used to bracket it, or None before the first solve"""
+        if not self.roots:
+            return None
+        x0 = self.roots[-1]
+        h = 0.01 * (self.x_end - self.x_start)
+        if len(self.roots) > 1 and self.values[-1] != self.values[-2]:
+            dx = self.roots[-1] - self.roots[-2]
+            slope = dx / (self.values[-1] - self.values[-2])
+            x0 += slope * (value - self.values[-1])
+            h = max(0.25 * abs(dx), 1e-6 * (self.x_end - self.x_start))
+        return min(max(x0, self.x_start), self.x_end), h
+
+    def solve(self, value: float, stats: SolverStats | None = None, **kwargs) -> float:
+        """Find the root for the parameter value. Other keyword arguments
+        are passed to f"""
+        kwargs[self.param] = value
+        start = self.guess(value)
+        bracket = None
+        if start is not None:
+            bracket = self._bracket_near(*start, stats, kwargs)
+
+        if bracket is None:  # Cold start
+            x1, x2 = find_bracket_adaptive(
+                self.f,
+                self.x_start,
+                self.x_end,
+                monotonic=self.monotonic,
+                stats=stats,
+                **kwargs,
+            )
+            f1 = f2 = None
+        else:
+            x1, x2, f1, f2 = bracket
+
+        x = solve(
+            self.f,
+            (x1, x2),
+            self.method,
+            self.max_iter,
+            self.tol,
+            stats=stats,
+            f1=f1,
+            f2=f2,
+            **kwargs,
+        )
+        self.values.append(value)
+        self.roots.append(x)
+        return x
+
+    def _bracket_near(
+        self,
+        x0: float,
+        h: float,
+        stats: SolverStats | None,
+        kwargs: dict,
+        max_steps: int = 30,
+    ) -> tuple[float, float, float | None, float | None] | None:
+        """Step outwards on both sides of x0, doubling the step each time,
+        until f changes sign. Returns (x1, x2, f(x1), f(x2)), or None if the
+        interval is exhausted without a sign change"""
+        f = self.f if stats is None else stats.start(self.f)
+        f0 = f(x0, **kwargs)
+        if f0 == 0:
+            return _stop(stats, "root", (x0, x0, None, None))
+
+        xl = xr = x0
+        fl = fr = f0
+        for _ in range(max_steps):
+            if xr < self.x_end:
+                x = min(xr + h, self.x_end)
+                fx = f(x, **kwargs)
+                if fx * fr <= 0:
+                    return _stop(stats, "bracket", (xr, x, fr, fx))
+                xr, fr = x, fx
+            if xl > self.x_start:
+                x = max(xl - h, self.x_start)
+                fx = f(x, **kwargs)
+                if fx * fl <= 0:
+                    return _stop(stats, "bracket", (x, xl, fx, fl))
+                xl, fl = x, fx
+            if xl <= self.x_start and xr >= self.x_end:
+                break
+            h *= 2
+        return _stop(stats, "no_bracket")
+
+
+def sweep(
+    f: Callable,
+    values: ArrayLike,
+    x_start: float,
+    x_end: float,
+    param: str,
+    method: str = "brent",
+    tol: float = 1e-12,
+    max_iter: int | None = None,
+    monotonic: bool = False,
+    stats: SolverStats | None = None,
+    **kwargs,
+) -> NDArray[np.float64]:
+    """
+    Find the roots of f(x, **{param: p}) = 0 for each value p in values
+    using a Continuation, so that each solve is warm-started from the
+    previous roots. Values should be ordered so that consecutive roots are
+    close, e.g. increasing or decreasing.
+
+    Parameters
+    ----------
+    f, x_start, x_end, param, method, tol, max_iter, monotonic :
+        As for Continuation.
+    values : array_like
+        Values of the parameter, in the order in which they are solved.
+    stats : SolverStats, optional
+        Statistics object to record the evaluations, iterations and time.
+    **kwargs :
+        Additional keyword arguments passed to f.
+
+    Returns
+    -------
+    ndarray
+        The roots, one for each of the values.
+    """
+    cont = Continuation(f, x_start, x_end, param, method, tol, max_iter, monotonic)
+    return np.array([cont.solve(value, stats, **kwargs) for value in values])
+
+
 if __name__ == "__main__":
 
     def f(x: float, **kwargs) -> float:
@@ -230,6 +1331,31 @@ if __name__ == "__main__":
 
     x1, x2 = find_bracket(f, -10, 10, 100, a=2, b=-3, c=-4)
     print(x1, x2)
-    print(brent_root(f, x1, x2, max_iter=30, tol=1e-12, a=2, b=-3, c=-4))
+    print(find_bracket_adaptive(f, -10, 10, a=2, b=-3, c=-4))
+    stats = SolverStats()
+    print(brent_root(f, x1, x2, max_iter=30, tol=1e-12, stats=stats, a=2, b=-3, c=-4))
+    print(stats)
 
     print(bisection(f, x1, x2, max_iter=100, tol=1e-12, a=2, b=-3, c=-4))
+
+    for method in ("brent", "bisection", "chandrupatla", "itp"):
+        stats = SolverStats()
+        x = solve(f, (x1, x2), method, 100, stats=stats, a=2, b=-3, c=-4)
+        print(f"{method:>12}: {x} nfev={stats.nfev}")
+
+    def fprime(x: float, **kwargs) -> float:
+        return 2 * kwargs["a"] * x + kwargs["b"]
+
+    stats = SolverStats()
+    x = newton_safe(f, x1, x2, fprime, stats=stats, a=2, b=-3, c=-4)
+    print(f"{'newton':>12}: {x} nfev={stats.nfev} ndev={stats.ndev}")
+
+    def g(x: float, **kwargs) -> float:
+        return np.sin(x) - 0.5 * np.cos(3 * x)
+
+    print(find_all_roots(g, -np.pi, np.pi))
+
+    c = np.linspace(-10, -1, 5)
+    stats = SolverStats()
+    print(sweep(f, c, 0.0, 10.0, "c", stats=stats, a=2, b=-3), stats.nfev)
+    print(brent_root_batch(f, 0.0, 10.0, a=2, b=-3, c=c))
@@ -27,7 +27,7 @@ def _(concrete, np, plt, rcd, rebar_primary):
     def _csb(fck, np, plt, rcd):
         concrete = rcd.Concrete(fck=fck)
         x = np.concatenate((np.linspace(0, 0.002, 21), np.linspace(0.0025, 0.0035, 6)))
-        y = np.array([concrete.fc(ec) for ec in x])
+        y = concrete.fc(x)
         plt.figure(figsize=(5, 3))
         plt.plot(x, y)
         plt.grid()
@@ -47,7 +47,7 @@ def _(concrete, np, plt, rcd, rebar_primary):
                     np.array([steel.es_fs[6, 0], steel.es_fs[6, 0] + 0.01]),
                 )
             )
-            yy = np.array([steel.fs(es) for es in xx])
+            yy = steel.fs(xx)
         else:
             steel = rcd.RebarMS(fy=fy,)
             xx = np.array([0.0, 100/115*fy/2e5, 2*100/115*fy/2e5])
@@ -1,10 +1,15 @@
 from fractions import Fraction as F
 import math
+import os
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, wraps
+from pathlib import Path
+from contextlib import contextmanager
 from enum import Enum
 from collections import OrderedDict
-from typing import ClassVar
+from typing import Callable, ClassVar
 from typing_extensions import Annotated
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
 import numpy as np
@@ -12,25 +17,138 @@ import numpy as np
 # import matplotlib.pyplot as plt
 from numpy.typing import NDArray
 
-from brent import find_bracket, brent_root, bisection
+from brent import (
+    SolverStats,
+    find_bracket,
+    find_bracket_adaptive,
+    bisection,
+    solve,
+)
 
 Array2D = Annotated[NDArray[np.float64], ("n", "m")]
 
 
-def interpolate_xy(xy: Array2D, x: float) -> float:
+class NumericBackend(Enum):
+    """How the rational constants of IS456 returned by Q() are represented.
+    EXACT gives exact constants only: results are Fractions where every
+    input is a Fraction or an int and the calculation is rational, such as
+    Concrete.fd, k_pivot and the areas, moments and centroids of the stress
+    block for a Fraction k. Float inputs (strains, dimensions), math.sqrt
+    (as in reqd_xu_d()) and numpy make the results float"""
+
+    EXACT = 1  # Rational constants are fractions.Fraction, for verification
+    FLOAT = 2  # Rational constants are float, for production runs
+
+
+_backend = NumericBackend.FLOAT
+
+
+def get_numeric_backend() -> NumericBackend:
+    return _backend
+
+
+def set_numeric_backend(backend: NumericBackend) -> None:
+    global _backend
+    _backend = NumericBackend(backend)
+
+
+@contextmanager
+def numeric_backend(backend: NumericBackend):
+    """Use the numeric backend within a with block, e.g. to verify a design
+    with exact rational constants, and restore the previous backend after"""
+    previous = get_numeric_backend()
+    set_numeric_backend(backend)
+    try:
+        yield
+    finally:
+        set_numeric_backend(previous)
+
+
+def Q(n: int, d: int = 1) -> float | F:
+    """Rational constant n/d of IS456 in the selected numeric backend: a
+    Fraction in the EXACT backend, a float in the FLOAT backend"""
+    if _backend is NumericBackend.EXACT:
+        return F(n, d)
+    return n / d
+
+
+def interpolate_xy(xy: Array2D, x: float | NDArray) -> float | NDArray:
+    """Linear interpolation in the table xy, whose first column is in
+    ascending order. Returns 0.0 for x outside the table. x may be an array"""
+    if np.ndim(x) > 0:
+        x = np.asarray(x, dtype=float)
+        y = np.interp(x, xy[:, 0], xy[:, 1])
+        return np.where((x < xy[0, 0]) | (x > xy[-1, 0]), 0.0, y)
+
     if x < xy[0, 0] or x > xy[-1, 0]:
         return 0.0
-    for i in range(len(xy)):
-        if math.isclose(x, xy[i, 0]):
-            return xy[i, 1]
-        elif x < xy[i, 0]:
-            x1 = xy[i - 1, 0]
-            y1 = xy[i - 1, 1]
-            x2 = xy[i, 0]
-            y2 = xy[i, 1]
-            y = y1 + (y2 - y1) / (x2 - x1) * (x - x1)
-            return y
-    return 0.0
+    return float(np.interp(x, xy[:, 0], xy[:, 1]))
+
+
+def _readonly(a: NDArray) -> NDArray:
+    a.setflags(write=False)
+    return a
+
+
+# IS456:2000 Table 20, maximum shear stress tau_cmax for grades fck
+IS456_TABLE20: Array2D = _readonly(
+    np.array([[15, 20, 25, 30, 35, 40], [2.5, 2.8, 3.1, 3.5, 3.7, 4.0]], dtype=float).T
+)
+
+# IS456:2000 Cl. 40.2.1.1, factor k on tau_c for solid slabs of overall depth D
+IS456_SLAB_K: Array2D = _readonly(
+    np.array(
+        [
+            [150, 175, 200, 225, 250, 275, 300],
+            [1.3, 1.25, 1.2, 1.15, 1.1, 1.05, 1.0],
+        ],
+        dtype=float,
+    ).T
+)
+
+
+def tau_cmax_is456(
+    fck: float | NDArray, slab: bool | NDArray = False
+) -> float | NDArray:
+    """Maximum shear stress tau_cmax from IS456 Table 20, halved for solid
+    slabs. Grades below M15 or above M40 take the end values and grades
+    between the tabulated ones return 0.0. fck and slab may be arrays, which
+    are broadcast together"""
+    fck = np.asarray(fck, dtype=float)
+    grades, values = IS456_TABLE20[:, 0], IS456_TABLE20[:, 1]
+    i = np.clip(np.searchsorted(grades, fck), 0, len(grades) - 1)
+    tau_cmax = np.where(grades[i] == fck, values[i], 0.0)
+    tau_cmax = np.where(fck >= grades[-1], values[-1], tau_cmax)
+    tau_cmax = np.where(fck <= grades[0], values[0], tau_cmax)
+    tau_cmax = np.where(slab, tau_cmax / 2.0, tau_cmax)
+    return tau_cmax if tau_cmax.ndim else float(tau_cmax)
+
+
+def slab_k_is456(D: float | NDArray) -> float | NDArray:
+    """Factor k on tau_c for solid slabs of overall depth D, IS456 Cl.
+    40.2.1.1. D may be an array"""
+    k = np.interp(D, IS456_SLAB_K[:, 0], IS456_SLAB_K[:, 1])
+    return k if np.ndim(k) else float(k)
+
+
+def tau_c_is456(
+    pt: float | NDArray, fck: float | NDArray, D: float | NDArray | None = None
+) -> float | NDArray:
+    """Design shear strength of concrete tau_c from IS456 Table 19 for a
+    percentage pt of tension steel and grade fck. If the overall depth D is
+    given, the section is a solid slab and tau_c is multiplied by the factor
+    k of Cl. 40.2.1.1. Arguments may be arrays, which are broadcast together"""
+    if np.ndim(pt) == 0 and np.ndim(fck) == 0 and np.ndim(D) == 0:
+        beta = max(1.0, 0.8 * fck / (6.89 * pt))
+        tau_c = 0.85 * (0.8 * fck) ** 0.5 * ((1 + 5 * beta) ** 0.5 - 1) / (6 * beta)
+    else:
+        pt, fck = np.asarray(pt, dtype=float), np.asarray(fck, dtype=float)
+        with np.errstate(divide="ignore"):
+            beta = np.maximum(1.0, 0.8 * fck / (6.89 * pt))
+        tau_c = 0.85 * np.sqrt(0.8 * fck) * (np.sqrt(1 + 5 * beta) - 1) / (6 * beta)
+    if D is not None:
+        tau_c = tau_c * slab_k_is456(D)
+    return tau_c
 
 
 class FlexuralMemberType(Enum):
@@ -56,9 +174,18 @@ class Concrete:
 
     @property
     def fd(self):
-        return F(4, 9) * self.fck
+        return Q(4, 9) * self.fck
+
+    def fc(self, ec: float | NDArray) -> float | NDArray:
+        """Stress in concrete at strain ec. ec may be an array of strains, in
+        which case an array of stresses of the same shape is returned"""
+        if np.ndim(ec) > 0:  # Array of strains
+            ec = np.asarray(ec, dtype=float)
+            fd = float(self.fd)
+            ec_ecy = ec / self.ecy
+            fc = np.where(ec >= self.ecy, fd, fd * (2 * ec_ecy - ec_ecy**2))
+            return np.where((ec <= 0) | (ec > self.ecu), 0.0, fc)
 
-    def fc(self, ec: float) -> float:
         if (ec <= 0) or (ec > self.ecu):
             return 0.0
         elif self.ecy <= ec <= self.ecu:
@@ -67,27 +194,28 @@ class Concrete:
             ec_ecy = ec / self.ecy
             return self.fd * (2 * ec_ecy - ec_ecy**2)
 
+    @property
+    def k_pivot(self) -> float | F:
+        """Depth from the highly compressed edge, as a fraction of D, of the
+        point at which strain is ecy when the whole section is in compression"""
+        return Q(3, 7)
+
+    def stress_block(self, k: float) -> "StressBlock":
+        """Stress block of this concrete for NA depth k as a fraction of D"""
+        return csb_cached(k)
+
+    def block_integrals(
+        self, k: NDArray, z1: NDArray, z2: NDArray
+    ) -> tuple[NDArray, NDArray, NDArray]:
+        """Area, moment and centroid of stress_block(k) between z1 and z2 for
+        arrays of k, z1 and z2"""
+        return csb_integrals(k, z1, z2)
+
     def tau_cmax(self) -> float:
-        table20 = np.array(
-            [[15, 20, 25, 30, 35, 40], [2.5, 2.8, 3.1, 3.5, 3.7, 4.0]], dtype=float
-        ).T
-
-        if self.fck >= table20[-1, 0]:
-            return table20[-1, 1]
-        elif self.fck <= table20[0, 0]:
-            return table20[0, 1]
-
-        for i in range(len(table20)):
-            if self.fck == table20[i, 0]:
-                return table20[i, 1]
-        return 0.0
+        return tau_cmax_is456(self.fck)
 
-    def tau_c(self, pt: float) -> float:
-        beta = max(1.0, 0.8 * self.fck / (6.89 * pt))
-        tau_c = (
-            0.85 * (0.8 * self.fck) ** 0.5 * ((1 + 5 * beta) ** 0.5 - 1) / (6 * beta)
-        )
-        return tau_c
+    def tau_c(self, pt: float | NDArray) -> float | NDArray:
+        return tau_c_is456(pt, self.fck)
 
 
 class RebarType(Enum):
@@ -101,12 +229,34 @@ ep: Array2D = np.array(
 ).T
 
 
+@dataclass(frozen=True)
+class HYSDCurve:
+    """Design stress-strain curve of HYSD bars of one grade, shared by all
+    RebarHYSD instances of that grade. es_fs is read-only, es and fs hold the
+    same points as tuples for fast lookup of a single strain with bisect"""
+
+    es_fs: Array2D = field(repr=False)
+    es: tuple[float, ...]
+    fs: tuple[float, ...]
+
+
+@lru_cache(maxsize=None)
+def hysd_curve(fy: float, Es: float = 2e5) -> HYSDCurve:
+    """Registry of HYSD stress-strain curves, built once per (fy, Es)"""
+    es_fs = np.zeros(ep.shape)
+    es_fs[:, 1] = 100 / 115 * fy * ep[:, 1]
+    es_fs[:, 0] = es_fs[:, 1] / Es + ep[:, 0]
+    es_fs.setflags(write=False)
+    return HYSDCurve(es_fs, tuple(es_fs[:, 0].tolist()), tuple(es_fs[:, 1].tolist()))
+
+
 @dataclass
 class Rebar(ABC):
     fy: float
     rebar_type: RebarType = RebarType.UNDEFINED
     label: str = ""
     Es: ClassVar[float] = 2e5
+    es_offset: ClassVar[float] = 0.002  # Added to fd / Es for xumax, IS456 38.1(f)
 
     @abstractmethod
     def fs(self, es: float) -> float: ...
@@ -125,9 +275,17 @@ class RebarMS(Rebar):
 
         self.es_fs = np.array([[0.0, self.fd / self.Es], [0.0, self.fd]]).T
 
-    def fs(self, es: float) -> float:
-        _es = abs(es)
+    def fs(self, es: float | NDArray) -> float | NDArray:
+        """Stress in steel at strain es. es may be an array of strains, in
+        which case an array of stresses of the same shape is returned"""
         fsy = self.es_fs[1, 1]
+        if np.ndim(es) > 0:  # Array of strains
+            es = np.asarray(es, dtype=float)
+            return np.where(
+                np.abs(es) < fsy / self.Es, es * self.Es, np.copysign(fsy, es)
+            )
+
+        _es = abs(es)
         if _es < fsy / self.Es:
             return es * self.Es
         else:
@@ -141,43 +299,35 @@ class RebarHYSD(Rebar):
         if not self.label:
             self.label = f"{self.rebar_type} {self.fy}"
 
-        _ep: Array2D = np.array(
-            [
-                [0.0, 0.0, 0.0001, 0.0003, 0.0007, 0.001, 0.002],
-                [0.0, 0.8, 0.85, 0.9, 0.95, 0.975, 1.0],
-            ]
-        ).T
-        self.es_fs = np.zeros(_ep.shape)
-        self.es_fs = self.HYSD_es_fs(_ep)
+        self.curve = hysd_curve(self.fy, self.Es)
+        self.es_fs = self.curve.es_fs
 
-    def HYSD_es_fs(self, ep: Array2D):
-        es_fs = np.zeros(ep.shape)
-        es_fs[:, 1] = self.fd * ep[:, 1]
-        es_fs[:, 0] = es_fs[:, 1] / self.Es + ep[:, 0]
-        return es_fs
+    def fs(self, es: float | NDArray) -> float | NDArray:
+        """Stress in steel at strain es. es may be an array of strains, in
+        which case an array of stresses of the same shape is returned"""
+        if np.ndim(es) > 0:  # Array of strains
+            es = np.asarray(es, dtype=float)
+            _es = np.abs(es)
+            # Beyond the last point of the table np.interp() returns fd
+            fs = np.interp(_es, self.es_fs[1:, 0], self.es_fs[1:, 1])
+            return np.where(_es <= self.es_fs[1, 0], es * self.Es, np.copysign(fs, es))
 
-    def fs(self, es: float) -> float:
         _es = abs(es)
-        if _es <= self.es_fs[1, 0]:
+        es_, fs_ = self.curve.es, self.curve.fs
+        if _es <= es_[1]:
             return es * self.Es
-        elif _es >= self.es_fs[-1, 0]:
-            return math.copysign(self.es_fs[-1, 1], es)
+        elif _es >= es_[-1]:
+            return math.copysign(fs_[-1], es)
         else:
             # _es lies between FSD * 0.8 fy and FSD * fy
-            i = 2
-            numrows = self.es_fs.shape[0]
-            while (_es > self.es_fs[i, 0]) and (i < numrows):
-                i += 1
-            if i > numrows:
-                raise ValueError(f"Invalid strain value {es}")
-            # print(i, es_fs[i, :])
-            if math.isclose(_es, self.es_fs[i, 0]):
-                return math.copysign(self.es_fs[i, 1], es)
+            i = bisect_left(es_, _es, 2)  # es_[i - 1] < _es <= es_[i]
+            if math.isclose(_es, es_[i]):
+                return math.copysign(fs_[i], es)
             else:
-                x1 = self.es_fs[i - 1, 0]
-                y1 = self.es_fs[i - 1, 1]
-                x2 = self.es_fs[i, 0]
-                y2 = self.es_fs[i, 1]
+                x1 = es_[i - 1]
+                y1 = fs_[i - 1]
+                x2 = es_[i]
+                y2 = fs_[i]
                 fs = y1 + (y2 - y1) / (x2 - x1) * (_es - x1)
                 return math.copysign(fs, es)
 
@@ -272,9 +422,9 @@ class CSB(StressBlock):
         if self.k < 0:
             raise ValueError(f"k = {self.k} must not be negative")
         if self.k <= 1:
-            self.alpha_k = F(4, 7) * self.k
+            self.alpha_k = Q(4, 7) * self.k
         else:
-            self.alpha_k = self.k - F(3, 7)
+            self.alpha_k = self.k - Q(3, 7)
 
     def z_values(
         self, z1: float, z2: float
@@ -359,6 +509,502 @@ class CSB(StressBlock):
         """z1 znd z1 are measured from the NA towards the highly compressed edge. 0 <= z1 <= z2 <= infinity"""
         return self.k - self.moment(z1, z2) / self.area(z1, z2)
 
+    @property
+    def dalpha_k(self) -> float:
+        """Derivative of alpha_k with respect to k"""
+        return Q(4, 7) if self.k <= 1 else 1
+
+    def stress(self, z: float) -> float:
+        """Stress at z as a fraction of the design strength fd, which is also
+        the derivative of area(z1, z) with respect to z"""
+        if z >= self.alpha_k:
+            return 1.0
+        z_a = z / self.alpha_k
+        return 2 * z_a - z_a**2
+
+    def area_dk(self, z1: float, z2: float) -> float:
+        """Partial derivative of area(z1, z2) with respect to k through alpha_k,
+        with z1 and z2 held constant. 0 <= z1 <= z2, k > 0"""
+        p1, p2 = min(z1, self.alpha_k), min(z2, self.alpha_k)
+        a = self.alpha_k
+        return self.dalpha_k * (
+            -(p2**2 - p1**2) / a**2 + 2 * (p2**3 - p1**3) / (3 * a**3)
+        )
+
+    def moment_dk(self, z1: float, z2: float) -> float:
+        """Partial derivative of moment(z1, z2) with respect to k through
+        alpha_k, with z1 and z2 held constant. 0 <= z1 <= z2, k > 0"""
+        p1, p2 = min(z1, self.alpha_k), min(z2, self.alpha_k)
+        a = self.alpha_k
+        return self.dalpha_k * (
+            -2 * (p2**3 - p1**3) / (3 * a**2) + (p2**4 - p1**4) / (2 * a**3)
+        )
+
+    def darea(self, z1: float, z2: float, dz1: float = 0.0, dz2: float = 1.0) -> float:
+        """Derivative of area(z1, z2) with respect to k when z1 and z2 change
+        with k at the rates dz1 and dz2. 0 <= z1 <= z2, k > 0"""
+        return self.stress(z2) * dz2 - self.stress(z1) * dz1 + self.area_dk(z1, z2)
+
+    def dmoment(
+        self, z1: float, z2: float, dz1: float = 0.0, dz2: float = 1.0
+    ) -> float:
+        """Derivative of moment(z1, z2) with respect to k when z1 and z2 change
+        with k at the rates dz1 and dz2. 0 <= z1 <= z2, k > 0"""
+        return (
+            z2 * self.stress(z2) * dz2
+            - z1 * self.stress(z1) * dz1
+            + self.moment_dk(z1, z2)
+        )
+
+
+@lru_cache(maxsize=1024)
+def _csb_cached(k: float, backend: NumericBackend) -> CSB:
+    return CSB(k)
+
+
+def csb_cached(k: float) -> CSB:
+    """CSB for k, shared between calls with the same k in the same numeric
+    backend. The returned object must not be modified"""
+    return _csb_cached(k, _backend)
+
+
+def csb_integrals(
+    k: float | NDArray, z1: float | NDArray, z2: float | NDArray
+) -> tuple[NDArray, NDArray, NDArray]:
+    """Area, moment about the NA and centroid of the concrete stress block of
+    CSB(k) between z1 and z2, computed for arrays of k, z1 and z2 in one call.
+    Arguments are broadcast together and the results have the broadcast
+    shape. The centroid is nan where the area is zero"""
+    k = np.asarray(k, dtype=float)
+    if np.any(k < 0):
+        raise ValueError("k must not be negative")
+    z1, z2 = np.asarray(z1, dtype=float), np.asarray(z2, dtype=float)
+    z1, z2 = np.minimum(z1, z2), np.maximum(z1, z2)
+    alpha_k = np.where(k <= 1, 4 / 7 * k, k - 3 / 7)
+
+    # Parabolic portion between p1 and p2, constant portion between r1 and r2
+    p1, p2 = np.minimum(z1, alpha_k), np.minimum(z2, alpha_k)
+    r1, r2 = np.maximum(z1, alpha_k), np.maximum(z2, alpha_k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(alpha_k > 0, alpha_k, 1.0)  # alpha_k = 0 only when k = 0
+        Ap = (p2**2 - p1**2) / a - (p2**3 - p1**3) / (3 * a**2)
+        Mp = 2 * (p2**3 - p1**3) / (3 * a) - (p2**4 - p1**4) / (4 * a**2)
+        area = Ap + (r2 - r1)
+        moment = Mp + (r2**2 - r1**2) / 2
+        centroid = np.where(area > 0, k - moment / area, np.nan)
+    return area, moment, centroid
+
+
+@dataclass(eq=False)
+class StressStrainTable:
+    """Stress-strain law of concrete tabulated as strains ec increasing from 0
+    and stresses sc as fractions of fd, joined by straight lines. Cumulative
+    integrals of sc and sc * ec with respect to ec up to each point are
+    computed once, so that integrals up to any strain are table lookups.
+    Strains ecy and ecu fix the strain profile, as in IS456 Cl. 38.1"""
+
+    ec: NDArray
+    sc: NDArray
+    ecy: float
+    ecu: float
+
+    def __post_init__(self):
+        ec, sc = np.asarray(self.ec, dtype=float), np.asarray(self.sc, dtype=float)
+        if ec.ndim != 1 or ec.shape != sc.shape or len(ec) < 2:
+            raise ValueError("Error: ec and sc must be 1-D arrays of equal length")
+        if ec[0] != 0 or np.any(np.diff(ec) <= 0):
+            raise ValueError("Error: ec must increase strictly from 0")
+        if not 0 < self.ecy <= self.ecu <= ec[-1]:
+            raise ValueError(f"Error: Need 0 < ecy <= ecu <= {ec[-1]}")
+        h = np.diff(ec)
+        g = np.diff(sc) / h  # Slope of each segment
+        s0, e0 = sc[:-1], ec[:-1]
+        dC = s0 * h + g * h**2 / 2
+        dM = s0 * e0 * h + (s0 + g * e0) * h**2 / 2 + g * h**3 / 3
+        self.ec, self.sc, self.slope = _readonly(ec), _readonly(sc), _readonly(g)
+        self.C = _readonly(np.concatenate(([0.0], np.cumsum(dC))))
+        self.M = _readonly(np.concatenate(([0.0], np.cumsum(dM))))
+        # Segments as tuples for fast lookup of a single strain with bisect
+        self._ec = tuple(ec.tolist())
+        self._segments = tuple(zip(*(a.tolist() for a in (e0, s0, g, self.C, self.M))))
+
+    def _segment(self, ec: float) -> tuple[float, float, float, float, float, float]:
+        """Distance t of a single strain ec, clipped to the table, from the start
+        e0 of its segment, with s0, g, C and M at e0"""
+        ec = min(max(ec, 0.0), self._ec[-1])
+        i = min(bisect_right(self._ec, ec), len(self._segments)) - 1
+        e0, s0, g, C0, M0 = self._segments[i]
+        return ec - e0, e0, s0, g, C0, M0
+
+    def stress(self, ec: float | NDArray) -> float | NDArray:
+        """Stress at strain ec as a fraction of fd, zero outside the table"""
+        if np.ndim(ec) > 0:
+            return np.interp(ec, self.ec, self.sc, left=0.0, right=0.0)
+        if ec < 0 or ec > self._ec[-1]:
+            return 0.0
+        t, _, s0, g, _, _ = self._segment(ec)
+        return s0 + g * t
+
+    def integrals(self, ec: float | NDArray) -> tuple[float | NDArray, float | NDArray]:
+        """Integrals of sc and of sc * ec with respect to strain from 0 to ec.
+        Strains beyond the table contribute nothing. ec may be an array"""
+        if np.ndim(ec) == 0:
+            t, e0, s0, g, C0, M0 = self._segment(ec)
+            C = C0 + s0 * t + g * t**2 / 2
+            M = M0 + s0 * e0 * t + (s0 + g * e0) * t**2 / 2 + g * t**3 / 3
+            return C, M
+        ec = np.clip(ec, 0.0, self.ec[-1])
+        i = np.clip(
+            np.searchsorted(self.ec, ec, side="right") - 1, 0, len(self.slope) - 1
+        )
+        e0, s0, g = self.ec[i], self.sc[i], self.slope[i]
+        t = ec - e0
+        C = self.C[i] + s0 * t + g * t**2 / 2
+        M = self.M[i] + s0 * e0 * t + (s0 + g * e0) * t**2 / 2 + g * t**3 / 3
+        return C, M
+
+
+@dataclass
+class TabulatedStressBlock(StressBlock):
+    """Stress block for NA depth k on a StressStrainTable. As in CSB, z is
+    measured from the NA towards the highly compressed edge as a fraction of
+    D and stresses are fractions of fd. Strain is grad * z, which is ecu at
+    the highly compressed edge when k <= 1 and ecy at a depth of
+    (1 - ecy / ecu) from it when k > 1"""
+
+    k: float
+    table: StressStrainTable
+
+    def __post_init__(self):
+        if self.k < 0:
+            raise ValueError(f"k = {self.k} must not be negative")
+        t = self.table
+        if self.k == 0:  # No compression zone
+            self.grad, self.dgrad = 0.0, 0.0
+        elif self.k <= 1:
+            self.grad = t.ecu / self.k
+            self.dgrad = -t.ecu / self.k**2
+        else:
+            c = self.k - (1 - t.ecy / t.ecu)
+            self.grad = t.ecy / c
+            self.dgrad = -t.ecy / c**2
+
+    def stress(self, z: float) -> float:
+        return self.table.stress(self.grad * z)
+
+    def area(self, z1: float, z2: float) -> float:
+        """0 <= z1 <= z2 <= k"""
+        if self.grad == 0:
+            return 0.0
+        C1, _ = self.table.integrals(self.grad * min(z1, z2))
+        C2, _ = self.table.integrals(self.grad * max(z1, z2))
+        return (C2 - C1) / self.grad
+
+    def moment(self, z1: float, z2: float) -> float:
+        """0 <= z1 <= z2 <= k"""
+        if self.grad == 0:
+            return 0.0
+        _, M1 = self.table.integrals(self.grad * min(z1, z2))
+        _, M2 = self.table.integrals(self.grad * max(z1, z2))
+        return (M2 - M1) / self.grad**2
+
+    def centroid(self, z1: float, z2: float) -> float:
+        return self.k - self.moment(z1, z2) / self.area(z1, z2)
+
+    def darea(self, z1: float, z2: float, dz1: float = 0.0, dz2: float = 1.0) -> float:
+        """Derivative of area(z1, z2) with respect to k when z1 and z2 change
+        with k at the rates dz1 and dz2. 0 <= z1 <= z2, k > 0"""
+        g, dg = self.grad, self.dgrad
+        de1, de2 = dg * z1 + g * dz1, dg * z2 + g * dz2
+        ds = self.stress(z2) * de2 - self.stress(z1) * de1
+        return (ds - self.area(z1, z2) * dg) / g
+
+    def dmoment(
+        self, z1: float, z2: float, dz1: float = 0.0, dz2: float = 1.0
+    ) -> float:
+        """Derivative of moment(z1, z2) with respect to k when z1 and z2 change
+        with k at the rates dz1 and dz2. 0 <= z1 <= z2, k > 0"""
+        g, dg = self.grad, self.dgrad
+        de1, de2 = dg * z1 + g * dz1, dg * z2 + g * dz2
+        ds = self.stress(z2) * g * z2 * de2 - self.stress(z1) * g * z1 * de1
+        return ds / g**2 - 2 * self.moment(z1, z2) * dg / g
+
+
+@dataclass(eq=False)
+class TabulatedConcrete(Concrete):
+    """Concrete with a design stress-strain law given as points (ec, fc) in
+    place of the parabola-rectangle law of IS456, such as EC2, high strength
+    or confined concrete. fd is the peak stress, ecy the strain at which it is
+    first reached and ecu the last strain in the table"""
+
+    ec_fc: Array2D
+
+    def __post_init__(self):
+        super().__post_init__()
+        ec_fc = np.asarray(self.ec_fc, dtype=float)
+        if ec_fc.ndim != 2 or ec_fc.shape[1] != 2:
+            raise ValueError("Error: ec_fc must be an array of (ec, fc) pairs")
+        i = int(np.argmax(ec_fc[:, 1]))
+        if ec_fc[i, 1] <= 0:
+            raise ValueError("Error: Stresses in ec_fc must not all be zero")
+        self._fd = float(ec_fc[i, 1])
+        self.ecy, self.ecu = float(ec_fc[i, 0]), float(ec_fc[-1, 0])
+        self.table = StressStrainTable(
+            ec_fc[:, 0], ec_fc[:, 1] / self._fd, self.ecy, self.ecu
+        )
+
+    @classmethod
+    def from_law(
+        cls,
+        fck: float,
+        law: Callable[[NDArray], NDArray],
+        ecy: float,
+        ecu: float,
+        n: int = 200,
+    ) -> "TabulatedConcrete":
+        """Concrete with law(ec), which returns stresses for an array of
+        strains, sampled at n segments between 0 and ecu and at ecy"""
+        ec = np.union1d(np.linspace(0, ecu, n + 1), [ecy])
+        return cls(fck, np.column_stack((ec, law(ec))))
+
+    @property
+    def fd(self) -> float:
+        return self._fd
+
+    @property
+    def k_pivot(self) -> float:
+        return 1 - self.ecy / self.ecu
+
+    def fc(self, ec: float | NDArray) -> float | NDArray:
+        fc = self.table.stress(ec) * self._fd
+        return fc if np.ndim(fc) else float(fc)
+
+    def stress_block(self, k: float) -> TabulatedStressBlock:
+        return TabulatedStressBlock(k, self.table)
+
+    def block_integrals(
+        self, k: NDArray, z1: NDArray, z2: NDArray
+    ) -> tuple[NDArray, NDArray, NDArray]:
+        k = np.asarray(k, dtype=float)
+        if np.any(k <= 0):
+            raise ValueError("k must be positive")
+        z1, z2 = np.asarray(z1, dtype=float), np.asarray(z2, dtype=float)
+        z1, z2 = np.minimum(z1, z2), np.maximum(z1, z2)
+        grad = np.where(
+            k <= 1, self.ecu / k, self.ecy / (k - self.k_pivot)
+        )  # As in TabulatedStressBlock
+        C1, M1 = self.table.integrals(grad * z1)
+        C2, M2 = self.table.integrals(grad * z2)
+        area, moment = (C2 - C1) / grad, (M2 - M1) / grad**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            centroid = np.where(area > 0, k - moment / area, np.nan)
+        return area, moment, centroid
+
+
+BAR_DIAS: tuple[float, ...] = (10, 12, 16, 20, 25, 32)
+
+
+@dataclass(frozen=True)
+class BarLayout:
+    """Tension bars in one or two layers. Each layer is a tuple of (n, dia)
+    groups. y is the distance of the centroid of the bars from the tension
+    face, so that d = D - y"""
+
+    layers: tuple[tuple[tuple[int, float], ...], ...]
+    area: float
+    y: float
+
+    def __str__(self) -> str:
+        return (
+            " / ".join(
+                " + ".join(f"{n}-#{dia:g}" for n, dia in layer) for layer in self.layers
+            )
+            + f" ({self.area:.2f})"
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class BarLayoutTable:
+    """Feasible tension bar layouts for one section width, sorted by area and
+    then by y. Layer 1 has n1 corner bars of dia1 and m1 bars of a smaller
+    dia1b between them, layer 2 has n2 bars of dia2 (n2 = 0 for one layer)"""
+
+    n1: NDArray
+    dia1: NDArray
+    m1: NDArray
+    dia1b: NDArray
+    n2: NDArray
+    dia2: NDArray
+    area: NDArray
+    y: NDArray
+
+    def layout(self, i: int) -> BarLayout:
+        layer1 = ((int(self.n1[i]), float(self.dia1[i])),)
+        if self.m1[i]:
+            layer1 += ((int(self.m1[i]), float(self.dia1b[i])),)
+        layers = (layer1,)
+        if self.n2[i]:
+            layers += (((int(self.n2[i]), float(self.dia2[i])),),)
+        return BarLayout(layers, float(self.area[i]), float(self.y[i]))
+
+    def lookup(self, Ast: float, tol: float = 0.05) -> BarLayout:
+        """Layout with the fewest bars, and then nearest the tension face,
+        among those whose area is not less than Ast and exceeds the least
+        such area by at most the fraction tol"""
+        i = int(np.searchsorted(self.area, Ast))
+        if i == len(self.area):
+            raise ValueError(f"Error: No bar layout provides Ast={Ast:.2f} mm^2")
+        j = int(np.searchsorted(self.area, self.area[i] * (1 + tol), side="right"))
+        nbars = self.n1[i:j] + self.m1[i:j] + self.n2[i:j]
+        return self.layout(i + int(np.lexsort((self.y[i:j], nbars))[0]))
+
+
+def _layer_fits(
+    w: float | NDArray,
+    n: float | NDArray,
+    dia: float | NDArray,
+    m: float | NDArray = 0,
+    dia_b: float | NDArray = 0.0,
+    agg: float = 20,
+) -> bool | NDArray:
+    """Whether n bars of diameter dia and m of a smaller diameter dia_b fit in
+    a layer of width w between the clear covers, with a clear distance of the
+    larger bar diameter and agg + 5 between bars (IS456 Cl. 26.3.2)"""
+    return n * dia + m * dia_b + (n + m - 1) * np.maximum(dia, agg + 5) <= w
+
+
+@lru_cache(maxsize=None)
+def bar_layout_table(
+    b: float,
+    clear_cover: float,
+    dias: tuple[float, ...] = BAR_DIAS,
+    agg: float = 20,
+) -> BarLayoutTable:
+    """All layouts of tension bars of diameters dias that fit in width b with
+    clear_cover to the bars on each side, as for d in RectBeamSection. Clear
+    distance between bars is at least the larger bar diameter and agg + 5
+    horizontally and the larger bar diameter, 15 and 2 agg / 3 vertically
+    (IS456 Cl. 26.3.2). Computed once per width"""
+    w = b - 2 * clear_cover  # Width available for bars in a layer
+    dias = tuple(sorted(dias))
+
+    def fits(n: int, dia: float, m: int = 0, dia_b: float = 0.0) -> bool:
+        return bool(_layer_fits(w, n, dia, m, dia_b, agg))
+
+    # Layer 1 as rows (n1, dia1, m1, dia1b, area, moment of area about the
+    # underside of the layer)
+    rows = []
+    for dia1 in dias:
+        for dia1b in (0.0,) + tuple(x for x in dias if x < dia1):
+            m_start = 1 if dia1b else 0
+            n1 = 2
+            while fits(n1, dia1, m_start, dia1b):
+                m1 = m_start
+                while fits(n1, dia1, m1, dia1b):
+                    a1, a1b = n1 * math.pi * dia1**2 / 4, m1 * math.pi * dia1b**2 / 4
+                    rows.append(
+                        (n1, dia1, m1, dia1b, a1 + a1b, (a1 * dia1 + a1b * dia1b) / 2)
+                    )
+                    if not dia1b:
+                        break
+                    m1 += 1
+                n1 += 1
+    if not rows:
+        raise ValueError(f"Error: No bars of diameters {dias} fit in width b={b}")
+    layer1 = np.array(rows)
+    nbars1 = layer1[:, 0] + layer1[:, 2]
+    tables = [
+        np.column_stack((layer1[:, :4], np.zeros((len(layer1), 2)), layer1[:, 4:]))
+    ]
+
+    # Layer 2 of n2 <= n1 + m1 bars of one diameter dia2 <= dia1
+    for dia2 in dias:
+        n2 = 2
+        while fits(n2, dia2):
+            l1 = layer1[(nbars1 >= n2) & (layer1[:, 1] >= dia2)]
+            gap = np.maximum(l1[:, 1], max(15, 2 * agg / 3))
+            a2 = n2 * math.pi * dia2**2 / 4
+            y2 = l1[:, 1] + gap + dia2 / 2
+            n = len(l1)
+            tables.append(
+                np.column_stack(
+                    (
+                        l1[:, :4],
+                        np.full(n, n2),
+                        np.full(n, dia2),
+                        l1[:, 4] + a2,
+                        l1[:, 5] + a2 * y2,
+                    )
+                )
+            )
+            n2 += 1
+    table = np.vstack(tables)
+    area = table[:, 6]
+    y = clear_cover + table[:, 7] / area
+    order = np.lexsort((y, area))
+    table, area, y = table[order], area[order], y[order]
+    return BarLayoutTable(
+        *(_readonly(np.ascontiguousarray(table[:, j])) for j in range(6)),
+        _readonly(area),
+        _readonly(y),
+    )
+
+
+@dataclass(eq=False)
+class RebarLayers:
+    """Layers of longitudinal bars, each of n bars of diameter dia at depth y
+    from the highly compressed edge. Negative y is measured from the other
+    edge, as in rcdesign. The layers are held as NumPy arrays"""
+
+    dia: NDArray
+    n: NDArray
+    y: NDArray
+
+    def __post_init__(self):
+        self.dia, self.n, self.y = np.broadcast_arrays(
+            *(np.asarray(a, dtype=float) for a in (self.dia, self.n, self.y))
+        )
+        if self.dia.ndim != 1:
+            raise ValueError("Error: dia, n and y must be 1-D arrays")
+        self.As = _readonly(self.n * np.pi * self.dia**2 / 4)
+
+    def depth(self, D: float) -> NDArray:
+        """Depth of each layer from the highly compressed edge of a section of
+        overall depth D"""
+        return np.where(self.y < 0, D + self.y, self.y)
+
+
+@dataclass
+class SectionAnalysis:
+    """Result of strain compatibility analysis of a section. C is the force
+    in concrete and es, fs and Fs the strain, stress and force (net of the
+    concrete displaced) in each layer of bars, compression positive"""
+
+    xu: float
+    Mu: float
+    C: float
+    es: NDArray
+    fs: NDArray
+    Fs: NDArray
+
+
+def _derived(method: Callable) -> Callable:
+    """Cache the value of a method without arguments on the instance, per
+    numeric backend. The cache is cleared when any field of the instance is
+    reassigned (see RectBeamSection.__setattr__), so materials assigned to a
+    section must not be modified in place"""
+    name = method.__qualname__
+
+    @wraps(method)
+    def wrapper(self):
+        cache = self.__dict__.setdefault("_derived", {})
+        key = (name, _backend)
+        if key not in cache:
+            cache[key] = method(self)
+        return cache[key]
+
+    return wrapper
+
 
 @dataclass
 class RectBeamSection:
@@ -373,6 +1019,7 @@ class RectBeamSection:
     cbar_dia: float = 20
     vbar_dia: float = 6
     member_type: FlexuralMemberType = FlexuralMemberType.BEAM
+    tbar_layout: BarLayout | None = None
 
     @staticmethod
     def num_bars(area: float, dia: float) -> str:
@@ -381,51 +1028,77 @@ class RectBeamSection:
         r = (a / area) - 1
         return f"{n}-#{dia} ({a:.2f} | {area:.2f}) {r:.2f}%"
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__dataclass_fields__:  # Derived values are now stale
+            self.__dict__.pop("_derived", None)
+
     @property
+    @_derived
     def d(self) -> float:
+        if self.tbar_layout is not None:
+            return self.D - self.tbar_layout.y
         return self.D - self.dc  # assuming a single layer of tension bars
 
     @property
+    @_derived
     def dc(self) -> float:
         return (
             self.clear_cover + self.cbar_dia / 2
         )  # assuming a single layer of tension bars
 
     @property
+    @_derived
     def Mulim(self) -> float:
         # xumax = self.xumax_d() * self.d
         return self.Mu(self.xumax)
 
+    @_derived
     def ptlim_fy_fck(self) -> float | F:
-        return F(115, 1) * self.Ac() * self.xumax_d()
+        return Q(115, 1) * self.Ac() * self.xumax_d()
 
+    @_derived
     def xumax_d(self) -> float:
         return self.conc.ecu / (
-            self.conc.ecy + self.conc.ecu + self.tbars.fd / self.tbars.Es
+            self.conc.ecu + self.tbars.fd / self.tbars.Es + self.tbars.es_offset
         )
 
     @property
+    @_derived
     def xumax(self) -> float:
         return self.xumax_d() * self.d
 
-    def Ac(self) -> F:
-        A1 = F(2, 3) * F(4, 7)
-        A2 = F(3, 7)
-        return F(4, 9) * (A1 + A2)
-
-    def Mc(self) -> F:
-        A1 = F(2, 3) * F(4, 7)
-        x1 = F(5, 8) * F(4, 7)
-        A2 = F(3, 7)
-        x2 = F(4, 7) + F(1, 2) * F(3, 7)
+    @_derived
+    def Ac(self) -> float | F:
+        """Force in concrete per unit width / (fck xu) for xu <= D, for which
+        the stress block of any law is the same shape"""
+        if type(self.conc) is not Concrete:
+            csb = self.conc.stress_block(1.0)
+            return csb.area(0, 1) * self.conc.fd / self.conc.fck
+        A1 = Q(2, 3) * Q(4, 7)
+        A2 = Q(3, 7)
+        return Q(4, 9) * (A1 + A2)
+
+    @_derived
+    def Mc(self) -> float | F:
+        if type(self.conc) is not Concrete:
+            return self.Ac() * (1 - self.xbar())
+        A1 = Q(2, 3) * Q(4, 7)
+        x1 = Q(5, 8) * Q(4, 7)
+        A2 = Q(3, 7)
+        x2 = Q(4, 7) + Q(1, 2) * Q(3, 7)
         Mc = A1 * x1 + A2 * x2
-        return F(4, 9) * Mc
+        return Q(4, 9) * Mc
 
+    @_derived
     def xbar(self) -> float | F:
+        """Depth of the centroid of the stress block / xu for xu <= D"""
+        if type(self.conc) is not Concrete:
+            return self.conc.stress_block(1.0).centroid(0, 1)
         A = self.Ac()
         M = self.Mc()
         xx = M / A
-        return F(1, 1) - xx
+        return Q(1, 1) - xx
 
     def Mu(self, xu: float) -> float:
         xumax = self.xumax
@@ -434,7 +1107,7 @@ class RectBeamSection:
         if xu > self.D:
             raise ValueError(f"xu = {xu} must lie within the section for bending")
         k = xu / self.D
-        csb = CSB(k)
+        csb = self.conc.stress_block(k)
         A = csb.area(0, k) * self.conc.fd * self.D
         # M = csb.moment(0, k)
         xbar = csb.centroid(0, k) * self.D
@@ -442,10 +1115,80 @@ class RectBeamSection:
         # print(f"{k=}, {csb.area(0, k)} {A=}, {xbar=}, {Mu=}")
         return Mu
 
-    def reqd_xu_d(self, Mu: float) -> float | F:
-        """Required x_u can be calculated explicitly for an under-reinforced rectangular section"""
-        return F(238, 198) - math.sqrt(
-            F(238, 198) ** 2 - F(147, 22) * Mu / (self.conc.fck * self.b * self.d**2)
+    def dMu_dk(self, csb: StressBlock, z1: float, dz1: float, width: float) -> float:
+        """Derivative with respect to k of the moment about the tension steel of
+        the compression in a strip of the given width extending from z1 to
+        the highly compressed edge, where z1 changes with k at the rate dz1"""
+        k = csb.k
+        A = csb.area(z1, k)
+        dA = csb.darea(z1, k, dz1, 1.0)
+        dM = csb.dmoment(z1, k, dz1, 1.0)
+        return (
+            self.conc.fd
+            * self.D
+            * width
+            * (dA * (self.d - k * self.D) - A * self.D + dM * self.D)
+        )
+
+    def dMu_dxu(self, xu: float) -> float:
+        """Derivative of Mu(xu) with respect to xu"""
+        k = xu / self.D
+        return self.dMu_dk(self.conc.stress_block(k), 0.0, 0.0, self.b) / self.D
+
+    def analyse(
+        self,
+        layers: RebarLayers,
+        method: str = "brent",
+        stats: SolverStats | None = None,
+    ) -> SectionAnalysis:
+        """Moment of resistance with bars in any number of layers, made of
+        tbars, by strain compatibility with a strain of ecu at the highly
+        compressed edge. The NA depth xu is the root of the sum of forces,
+        in which strains, stresses and forces of all layers are evaluated
+        together as arrays. Concrete is taken over the width b"""
+        y = layers.depth(self.D)
+
+        def forces(xu: float) -> tuple[float, float, NDArray, NDArray, NDArray]:
+            k = xu / self.D
+            csb = self.conc.stress_block(k)
+            C = csb.area(0, k) * self.conc.fd * self.D * self.b
+            es = self.conc.ecu * (xu - y) / xu
+            fs = self.tbars.fs(es)
+            Fs = layers.As * (fs - self.conc.fc(es))
+            return C, csb.centroid(0, k) * self.D, es, fs, Fs
+
+        def net_force(xu: float) -> float:
+            C, _, _, _, Fs = forces(xu)
+            return C + float(Fs.sum())
+
+        xu1, xu2 = 1e-9 * self.D, self.D
+        f1, f2 = net_force(xu1), net_force(xu2)
+        if f2 < 0:
+            raise ValueError("Error: Neutral axis lies outside the section")
+        xu = solve(
+            net_force,
+            (xu1, xu2),
+            method,
+            max_iter=50,
+            tol=1e-9,
+            stats=stats,
+            f1=f1,
+            f2=f2,
+        )
+        C, xc, es, fs, Fs = forces(xu)
+        Mu = -(C * xc + float(Fs @ y))
+        return SectionAnalysis(xu, Mu, C, es, fs, Fs)
+
+    def reqd_xu_d(self, Mu: float, b: float | None = None) -> float | F:
+        """Required x_u can be calculated explicitly for an under-reinforced rectangular section,
+        of width b if given, else self.b"""
+        b = self.b if b is None else b
+        if type(self.conc) is not Concrete:  # Mu = Ac fck b xu (d - xbar xu)
+            A, x = self.Ac(), self.xbar()
+            m = Mu / (self.conc.fck * b * self.d**2)
+            return (1 - math.sqrt(1 - 4 * x * m / A)) / (2 * x)
+        return Q(238, 198) - math.sqrt(
+            Q(238, 198) ** 2 - Q(147, 22) * Mu / (self.conc.fck * b * self.d**2)
         )
 
     def reqd_Ast(self, Mu: float) -> float | F:
@@ -475,6 +1218,23 @@ class RectBeamSection:
         else:  # Singly reinforced section
             return 0.0, 0.0, 0.0
 
+    def arrange_tbars(
+        self, Mu: float, dias: tuple[float, ...] = BAR_DIAS, max_iter: int = 5
+    ) -> BarLayout:
+        """Choose the layout of tension bars for Mu with the least area not
+        less than Ast (see BarLayoutTable.lookup()) and set it as tbar_layout,
+        which changes d. Repeated with increasing Ast until the layout
+        provides Ast required for the d it gives"""
+        table = bar_layout_table(self.b, self.clear_cover, tuple(dias))
+        self.tbar_layout = None
+        Ast = 0.0
+        for _ in range(max_iter):
+            Ast = max(Ast, self.Asc_Ast(Mu)[1])
+            if self.tbar_layout is not None and self.tbar_layout.area >= Ast:
+                return self.tbar_layout
+            self.tbar_layout = table.lookup(Ast)
+        raise ValueError(f"Error: Bar layout for Mu={Mu} did not converge")
+
     def Asc_Ast(self, Mu: float, factor: float = 1.0) -> tuple[float, float]:
         if Mu <= factor * self.Mulim:  # Singly reinforced section
             Asc = 0.0
@@ -503,19 +1263,7 @@ class RectBeamSection:
         if self.member_type == FlexuralMemberType.BEAM:
             return tauc
         elif self.member_type == FlexuralMemberType.SLAB:
-            if self.D <= 150:
-                k = 1.3
-            elif self.D >= 300:
-                k = 1.0
-            else:
-                xy = np.array(
-                    [
-                        [150, 175, 200, 225, 250, 275, 300],
-                        [1.3, 1.25, 1.2, 1.15, 1.1, 1.05, 1.0],
-                    ]
-                ).T
-                k = interpolate_xy(xy, self.D)
-            return k * tauc
+            return slab_k_is456(self.D) * tauc
         else:
             raise ValueError(f"Invalid member type {self.member_type}")
 
@@ -569,6 +1317,111 @@ class RectBeamSection:
                 sv = shear_reinf.sv(Vus, self.d)
                 return min(sv, shear_reinf.sv_max(self.b, self.d))
 
+    def sv_stations(
+        self, Vu: NDArray, Ast: float | NDArray, nlegs: int = 2, dia: float = 8
+    ) -> NDArray:
+        """Spacing of vertical stirrups of nlegs legs of diameter dia for shear
+        forces Vu at an array of stations, with tension steel Ast, which may
+        vary from station to station. Spacing is sv_max where concrete alone
+        resists Vu"""
+        Vu = np.abs(np.asarray(Vu, dtype=float))
+        tau_v = Vu / (self.b * self.d)
+        tau_cmax = self.tau_cmax()
+        if np.any(tau_v > tau_cmax):
+            i = int(np.argmax(tau_v))
+            raise ValueError(
+                f"Shear stress tau_v = {tau_v[i]:.2f} N/mm^2 exceeds maximum shear stress tau_cmax = {tau_cmax:.2f} N/mm^2"
+            )
+        Vus = Vu - self.tau_c(Ast) * self.b * self.d
+        stirrups = Stirrups(
+            self.vbars, nlegs, dia, 90.0, ShearReinforcementType.VERTICAL_STIRRUP
+        )
+        sv_max = stirrups.sv_max(self.b, self.d)
+        with np.errstate(divide="ignore"):
+            sv = self.vbars.fd * stirrups.Asv * self.d / Vus
+        return np.where(Vus > 0, np.minimum(sv, sv_max), sv_max)
+
+    def stirrup_zones(
+        self,
+        x: NDArray,
+        Vu: NDArray,
+        Ast: float | NDArray,
+        nlegs: int = 2,
+        dia: float = 8,
+        step: float = 25,
+        min_length: float = 0.0,
+    ) -> list["StirrupZone"]:
+        """Zones of uniform stirrup spacing along a span from shear forces Vu
+        at increasing stations x. Spacings from sv_stations() are rounded down
+        to a multiple of step and adjacent stations with the same spacing form
+        a zone. A zone shorter than min_length is taken over by a neighbour
+        with smaller spacing, or else extended into its neighbours. Zone
+        boundaries lie at the station on the side of the wider spacing, so
+        that the closer spacing covers the whole interval between stations"""
+        x = np.asarray(x, dtype=float)
+        sv = np.floor(self.sv_stations(Vu, Ast, nlegs, dia) / step) * step
+        if np.any(sv <= 0):
+            raise ValueError(f"Error: Stirrup spacing less than {step} required")
+        starts = np.flatnonzero(np.diff(sv)) + 1
+        closer = sv[starts] < sv[starts - 1]
+        bounds = np.concatenate(
+            ([x[0]], np.where(closer, x[starts - 1], x[starts]), [x[-1]])
+        )
+        zones = []
+        for x1, x2, s in zip(
+            bounds[:-1].tolist(), bounds[1:].tolist(), sv[np.r_[0, starts]].tolist()
+        ):
+            if zones and zones[-1].sv == s:  # Across a zone of no length
+                zones[-1] = StirrupZone(zones[-1].x1, x2, s)
+            elif x2 > x1 or len(bounds) == 2:
+                zones.append(StirrupZone(x1, x2, s))
+        while len(zones) > 1:
+            i = min(range(len(zones)), key=lambda i: zones[i].length)
+            zone = zones[i]
+            if zone.length >= min_length:
+                break
+            closer = [
+                j
+                for j in (i - 1, i + 1)
+                if 0 <= j < len(zones) and zones[j].sv < zone.sv
+            ]
+            if closer:  # Neighbour with closer stirrups takes over the zone
+                j = min(closer, key=lambda j: zones[j].sv)
+                zones[j] = StirrupZone(
+                    min(zones[j].x1, zone.x1), max(zones[j].x2, zone.x2), zones[j].sv
+                )
+                del zones[i]
+            elif i + 1 < len(zones):  # Extend the zone into the next zone
+                extra = min(min_length - zone.length, zones[i + 1].length)
+                zones[i] = StirrupZone(zone.x1, zone.x2 + extra, zone.sv)
+                zones[i + 1] = StirrupZone(
+                    zone.x2 + extra, zones[i + 1].x2, zones[i + 1].sv
+                )
+                if zones[i + 1].length <= 0:
+                    del zones[i + 1]
+            else:  # Last zone, extend into the previous zone
+                extra = min(min_length - zone.length, zones[i - 1].length)
+                zones[i] = StirrupZone(zone.x1 - extra, zone.x2, zone.sv)
+                zones[i - 1] = StirrupZone(
+                    zones[i - 1].x1, zone.x1 - extra, zones[i - 1].sv
+                )
+                if zones[i - 1].length <= 0:
+                    del zones[i - 1]
+        return zones
+
+
+@dataclass
+class StirrupZone:
+    """Vertical stirrups at spacing sv from x1 to x2 along the span"""
+
+    x1: float
+    x2: float
+    sv: float
+
+    @property
+    def length(self) -> float:
+        return self.x2 - self.x1
+
 
 @dataclass
 class FlangedSection(RectBeamSection):
@@ -580,6 +1433,7 @@ class FlangedSection(RectBeamSection):
         return self.b
 
     @property
+    @_derived
     def Mulim(self):
         """Limiting moment of resistance of flanged sections"""
         xumax = self.xumax
@@ -594,7 +1448,7 @@ class FlangedSection(RectBeamSection):
         if 0 <= xu <= self.D:  # NA lies within the section for bending
             k = xu / self.D
             # print(f"*** {xu=} {self.df=} {k=} {xu * float(F(3, 7))}")
-            csb = CSB(k)
+            csb = self.conc.stress_block(k)
             if xu <= self.df:  # NA within the flange
                 z1 = 0
                 z2 = k
@@ -604,7 +1458,7 @@ class FlangedSection(RectBeamSection):
                 # print(f"{z1=} {z2=} {A=} {Mu=}")
             else:  # NA outside the flange
                 Mw = super().Mu(xu)
-                if self.df <= xu * F(
+                if self.df <= xu * Q(
                     3, 7
                 ):  # Flange very thin flange and stress in flange is constant
                     z1 = (xu - self.df) / self.D
@@ -627,46 +1481,102 @@ class FlangedSection(RectBeamSection):
         else:
             raise ValueError(f"Distance of NA x_u = {xu} > {self.D}")
 
-    def reqd_xu(self, Mu: float) -> float:
+    def dMu_dxu(self, xu: float) -> float:
+        """Derivative of Mu(xu) with respect to xu"""
+        k = xu / self.D
+        csb = self.conc.stress_block(k)
+        if xu <= self.df:  # NA within the flange
+            return self.dMu_dk(csb, 0.0, 0.0, self.bf) / self.D
+        else:  # NA outside the flange
+            z1 = (xu - self.df) / self.D
+            Mf = self.dMu_dk(csb, z1, 1.0, self.bf - self.bw) / self.D
+            return super().dMu_dxu(xu) + Mf
+
+    def Cu(self, xu: float) -> float:
+        """Force in concrete for NA depth xu"""
+        k = xu / self.D
+        csb = self.conc.stress_block(k)
+        if xu <= self.df:  # NA within the flange
+            return self.conc.fd * self.D * csb.area(0, k) * self.bf
+        Cf = csb.area((xu - self.df) / self.D, k) * (self.bf - self.bw)
+        return self.conc.fd * self.D * (csb.area(0, k) * self.bw + Cf)
+
+    def reqd_xu(
+        self, Mu: float, method: str = "closed", stats: SolverStats | None = None
+    ) -> float:
+        """Depth of NA required for Mu. With method "closed" the NA below the
+        flange is found from flanged_reqd_xu() for the IS456 stress block, and
+        with solve() using "newton" for other concrete, else with solve() using
+        the given method. For Mu > Mulim, xumax is returned and the section is
+        doubly reinforced (see Asc_Ast())"""
+
         def find_xu(xu: float, reqd_Mu: float) -> float:
             return reqd_Mu - self.Mu(xu)
 
+        def dfind_xu(xu: float, reqd_Mu: float) -> float:
+            return -self.dMu_dxu(xu)
+
         xumax = self.xumax
         Mulim = self.Mulim
         # print(f"{xumax=} {Mulim=}")
         if xumax <= self.df:  # NA lies within the flange
-            reqd_xu = F(238, 198) - math.sqrt(
-                F(238, 198) ** 2
-                - F(147, 22) * Mu / (self.conc.fck * self.bf * self.d**2)
-            )
-            # print(f"1: Rectangular section {self.bf} x {self.d} {reqd_xu * self.d}")
-            return reqd_xu * self.d
+            if Mu > Mulim:  # Doubly reinforced flanged section
+                return xumax
+            # print(f"1: Rectangular section {self.bf} x {self.d}")
+            return self.reqd_xu_d(Mu, self.bf) * self.d
         else:  # NA lies below the flange
             Mu1 = self.Mu(self.df)
             if Mu <= Mu1:  # Required NA lies within the flange
-                reqd_xu = F(238, 198) - math.sqrt(
-                    F(238, 198) ** 2
-                    - F(147, 22) * Mu / (self.conc.fck * self.bf * self.d**2)
-                )
-                # print(f"2: Rectangular section {self.bf} x {self.d} {reqd_xu * self.d}")
-                return reqd_xu * self.d
+                # print(f"2: Rectangular section {self.bf} x {self.d}")
+                return self.reqd_xu_d(Mu, self.bf) * self.d
             else:  # Required NA lies below flange
-                Mulim = self.Mulim
                 if Mu <= Mulim:  # Singly reinforced flanged section
                     # print(f"3: NA below flange Singly reinforced: {Mu=} {Mulim=}")
-                    try:
-                        bracket = find_bracket(
-                            find_xu, self.df, self.xumax, 10, reqd_Mu=Mu
+                    if method == "closed" and type(self.conc) is Concrete:
+                        return float(
+                            flanged_reqd_xu(
+                                Mu,
+                                self.conc.fd,
+                                self.bw,
+                                self.bf,
+                                self.d,
+                                self.df,
+                                xumax,
+                            )
                         )
-                        reqd_xu = brent_root(
-                            find_xu, bracket[0], bracket[1], reqd_Mu=Mu
+                    # Mu(xu) increases monotonically from Mu(df) to Mulim,
+                    # hence (df, xumax) brackets the root
+                    if method == "closed":
+                        method = "newton"
+                    derivs = {"fprime": dfind_xu} if method == "newton" else {}
+                    try:
+                        reqd_xu = solve(
+                            find_xu,
+                            (self.df, self.xumax),
+                            method,
+                            stats=stats,
+                            f1=Mu - Mu1,
+                            f2=Mu - Mulim,
+                            reqd_Mu=Mu,
+                            **derivs,
                         )
                         return reqd_xu
                     except Exception as e:
                         raise ValueError("Error: FlangedSection.reqd_xu() failed")
                 else:  # Doubly reinforced flanged section
-                    print(f"4: NA below flange Doubly reinforced: {Mu=} {Mulim=}")
-                    return 0.0
+                    return xumax
+
+    def Asc_Ast(self, Mu: float, factor: float = 1.0) -> tuple[float, float]:
+        """Compression and tension steel for Mu. Beyond factor * Mulim the NA
+        is kept at xumax and compression steel resists Mu - Mulim"""
+        if Mu <= factor * self.Mulim:  # Singly reinforced section
+            return 0.0, self.Cu(self.reqd_xu(Mu)) / self.tbars.fd
+        xumax = self.xumax
+        esc = self.conc.ecu / xumax * (xumax - self.dc)
+        fsc_fcc = self.cbars.fs(esc) - self.conc.fc(esc)
+        Asc = (Mu - self.Mulim) / (fsc_fcc * (self.d - self.dc))
+        Ast = (self.Cu(xumax) + Asc * fsc_fcc) / self.tbars.fd
+        return Asc, Ast
 
     def __str__(self) -> str:
         s = f"Flanged Section: {self.bw}x{self.D} "
@@ -675,6 +1585,550 @@ class FlangedSection(RectBeamSection):
         return s
 
 
+def flanged_reqd_xu(
+    Mu: float | NDArray,
+    fd: float | NDArray,
+    bw: float | NDArray,
+    bf: float | NDArray,
+    d: float | NDArray,
+    df: float | NDArray,
+    xumax: float | NDArray = np.inf,
+) -> float | NDArray:
+    """Depth of NA below the flange, df < xu <= xumax, for which a flanged
+    section with the IS456 stress block resists Mu. When the whole flange is
+    at constant stress (xu >= 7 df / 3), Mu is quadratic in xu. Otherwise
+    Mu * xu^2 is a quartic in xu, whose roots are the eigenvalues of its
+    companion matrix. The result is clipped to [df, xumax], so that rounding
+    does not take it past the strain limits. Arguments may be arrays, which
+    are broadcast together"""
+    Mu, fd, bw, bf, d, df, xumax = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (Mu, fd, bw, bf, d, df, xumax))
+    )
+    shape = Mu.shape
+    Mu, fd, bw, bf, d, df, xumax = (np.ravel(v) for v in (Mu, fd, bw, bf, d, df, xumax))
+    bo = bf - bw  # Overhanging flange
+
+    # Thin flange, 33/98 bw fd xu^2 - 17/21 bw fd d xu + Mu - Mf = 0
+    Mf = fd * bo * df * (d - df / 2)
+    a, b = 33 / 98 * bw * fd, 17 / 21 * bw * fd * d
+    with np.errstate(invalid="ignore"):
+        xu = (b - np.sqrt(b**2 - 4 * a * (Mu - Mf))) / (2 * a)
+
+    thick = ~(xu >= 7 / 3 * df)
+    if np.any(thick):
+        _Mu, _fd, _bw, _bo, _d, _df = (v[thick] for v in (Mu, fd, bw, bo, d, df))
+        bf_ = _bw + _bo
+        c = np.column_stack(
+            (
+                -(27 / 3136 * bf_ + 21 / 64 * _bw) * _fd,
+                (9 / 112 * bf_ + 35 / 48 * _bw) * _d * _fd,
+                _fd * _bo * (7 / 16 * _d * _df - 7 / 32 * _df**2) - _Mu,
+                _fd * _bo * (21 / 16 * _d * _df**2 - 7 / 8 * _df**3),
+                _fd * _bo * (49 / 64 * _df**4 - 49 / 48 * _d * _df**3),
+            )
+        )
+        companion = np.zeros((len(c), 4, 4))
+        companion[:, 0, :] = -c[:, 1:] / c[:, :1]
+        companion[:, [1, 2, 3], [0, 1, 2]] = 1.0
+        roots = np.linalg.eigvals(companion)
+        # The root in df <= xu <= 7 df / 3, allowing for rounding
+        lo, hi = _df[:, None], 7 / 3 * _df[:, None]
+        miss = np.maximum(lo - roots.real, 0) + np.maximum(roots.real - hi, 0)
+        i = np.argmin(miss + np.abs(roots.imag), axis=1)
+        xu[thick] = roots.real[np.arange(len(c)), i]
+    xu = np.clip(xu, df, xumax)
+    return xu.reshape(shape) if shape else float(xu[0])
+
+
+def _columns(table, names: dict[str, float | None]) -> list[NDArray]:
+    """Columns of table (a DataFrame or a mapping of names to arrays or
+    scalars) as float arrays broadcast together. Missing columns take the
+    default given in names, or raise ValueError if the default is None"""
+    cols = []
+    for name, default in names.items():
+        try:
+            cols.append(np.asarray(table[name], dtype=float))
+        except KeyError:
+            if default is None:
+                raise ValueError(f"Error: Column {name} is missing from table")
+            cols.append(np.asarray(default, dtype=float))
+    return np.broadcast_arrays(*cols)
+
+
+def _fsc_fcc(esc: NDArray, fck: NDArray, fy: NDArray) -> tuple[NDArray, NDArray]:
+    """Stress in HYSD compression bars and in the concrete they displace at
+    strains esc, evaluated once for each distinct grade"""
+    fsc, fcc = np.empty_like(esc), np.empty_like(esc)
+    for grade in np.unique(fck):
+        m = fck == grade
+        fcc[m] = Concrete(grade).fc(esc[m])
+    for grade in np.unique(fy):
+        m = fy == grade
+        fsc[m] = RebarHYSD(grade).fs(esc[m])
+    return fsc, fcc
+
+
+def _stirrup_spacing(
+    b: NDArray,
+    d: NDArray,
+    Vu: NDArray,
+    Ast: NDArray,
+    fck: NDArray,
+    fyv: NDArray,
+    nlegs: NDArray,
+    vbar_dia: NDArray,
+) -> tuple[NDArray, NDArray, NDArray]:
+    """tau_v, tau_c and spacing of vertical stirrups as in design_shear(). The
+    spacing is nan where tau_v exceeds tau_cmax and sv_max where concrete
+    alone resists Vu"""
+    tau_v = Vu / (b * d)
+    tau_c = tau_c_is456(Ast * 100 / (b * d), fck)
+    Vus = Vu - tau_c * b * d
+    fvd_Asv = 100 / 115 * fyv * nlegs * np.pi * vbar_dia**2 / 4
+    sv_max = np.minimum(np.minimum(0.75 * d, fvd_Asv / (0.4 * b)), 300.0)
+    with np.errstate(divide="ignore"):
+        sv = np.where(Vus > 0, np.minimum(fvd_Asv * d / Vus, sv_max), sv_max)
+    return tau_v, tau_c, np.where(tau_v > tau_cmax_is456(fck), np.nan, sv)
+
+
+def _with_columns(table, result: dict[str, NDArray]):
+    """result added to table if it is a DataFrame, else result"""
+    if hasattr(table, "assign"):  # pandas DataFrame
+        return table.assign(**result)
+    return result
+
+
+def design_beams(table):
+    """Design rectangular beams for bending and vertical stirrups in one
+    vectorized pass, row for row equivalent to RectBeamSection.design_bending()
+    followed by design_shear(). table is a DataFrame, or a mapping of column
+    names to arrays or scalars, with columns
+
+    b, D, cover (clear cover), fck, fy, Mu, Vu and optionally Tu (0),
+    cbar_dia (20), nlegs (2), vbar_dia (8) and fyv (fy)
+
+    Bars are HYSD. The result has columns d, xu, Mulim, Asc, Ast, tau_v,
+    tau_c and sv, and is table with these columns added if table is a
+    DataFrame, else a dict of arrays. sv is nan where tau_v exceeds tau_cmax,
+    and sv_max where concrete alone resists Vu"""
+    b, D, cover, fck, fy, Mu, Vu, Tu, cbar_dia, nlegs, vbar_dia, fyv = _columns(
+        table,
+        {
+            "b": None,
+            "D": None,
+            "cover": None,
+            "fck": None,
+            "fy": None,
+            "Mu": None,
+            "Vu": None,
+            "Tu": 0.0,
+            "cbar_dia": 20.0,
+            "nlegs": 2.0,
+            "vbar_dia": 8.0,
+            "fyv": np.nan,
+        },
+    )
+    fyv = np.where(np.isnan(fyv), fy, fyv)
+    ecu = Concrete.ecu
+    dc = cover + cbar_dia / 2
+    d = D - dc
+    fd, fsd = 4 / 9 * fck, 100 / 115 * fy
+
+    # Limiting moment of resistance, Mulim = Mu(xumax)
+    xumax_d = ecu / (ecu + fsd / RebarHYSD.Es + RebarHYSD.es_offset)
+    xumax = xumax_d * d
+    k = xumax / D
+    area, _, centroid = csb_integrals(k, 0.0, k)
+    Mulim = area * fd * D * b * (d - centroid * D)
+
+    Mu = Mu + Tu * (1 + D / b) / 1.7
+    singly = Mu <= Mulim
+
+    # Singly reinforced, reqd_xu_d() and reqd_Ast()
+    area1, _, xbar = csb_integrals(1.0, 0.0, 1.0)  # Ac() = 4 / 9 * area1
+    c = 238 / 198
+    with np.errstate(invalid="ignore"):
+        xu = (c - np.sqrt(c**2 - 147 / 22 * Mu / (fck * b * d**2))) * d
+    Ast = np.where(singly, Mu / (fsd * (d - xbar * xu)), 0.0)
+    xu = np.where(singly, xu, xumax)
+
+    # Doubly reinforced, get_Asc()
+    Asc = np.zeros_like(Ast)
+    if not np.all(singly):
+        dbl = ~singly
+        esc = ecu / xumax[dbl] * (xumax[dbl] - dc[dbl])
+        fsc, fcc = _fsc_fcc(esc, fck[dbl], fy[dbl])
+        ptlim_fy_fck = 115 * 4 / 9 * area1 * xumax_d[dbl]
+        Ast1 = ptlim_fy_fck * fck[dbl] / fy[dbl] * b[dbl] * d[dbl] / 100
+        Asc[dbl] = (Mu[dbl] - Mulim[dbl]) / ((fsc - fcc) * (d[dbl] - dc[dbl]))
+        Ast[dbl] = Ast1 + Asc[dbl] * (fsc - fcc) / fsd[dbl]
+
+    tau_v, tau_c, sv = _stirrup_spacing(b, d, Vu, Ast, fck, fyv, nlegs, vbar_dia)
+    result = {
+        "d": d,
+        "xu": xu,
+        "Mulim": Mulim,
+        "Asc": Asc,
+        "Ast": Ast,
+        "tau_v": tau_v,
+        "tau_c": tau_c,
+        "sv": sv,
+    }
+    return _with_columns(table, result)
+
+
+def effective_flange_width(
+    l0: float | NDArray,
+    bw: float | NDArray,
+    df: float | NDArray,
+    spacing: float | NDArray,
+    L_beam: bool | NDArray = False,
+) -> float | NDArray:
+    """Effective width of flange of T-beams, or L-beams where L_beam is True,
+    IS456 Cl. 23.1.2, for distance l0 between points of zero moment, web
+    width bw, flange thickness df and spacing of beams, which limits bf to
+    the actual width of flange. Arguments may be arrays"""
+    T = l0 / 6 + bw + 6 * df
+    L = l0 / 12 + bw + 3 * df
+    bf = np.where(L_beam, np.minimum(L, (spacing + bw) / 2), np.minimum(T, spacing))
+    return bf if np.ndim(bf) else float(bf)
+
+
+def _flanged_Mu_Cu(
+    xu: NDArray,
+    fd: NDArray,
+    bw: NDArray,
+    bf: NDArray,
+    D: NDArray,
+    d: NDArray,
+    df: NDArray,
+) -> tuple[NDArray, NDArray]:
+    """FlangedSection.Mu() and Cu() for arrays"""
+    k = xu / D
+    in_flange = xu <= df
+    A, _, xc = csb_integrals(k, 0.0, k)
+    Af, _, xf = csb_integrals(k, np.maximum(xu - df, 0) / D, k)
+    Cw = fd * D * A * np.where(in_flange, bf, bw)
+    Cf = np.where(in_flange, 0.0, fd * D * Af * (bf - bw))
+    Cf_d = np.where(in_flange, 0.0, Cf * (d - np.nan_to_num(xf) * D))
+    return Cw * (d - xc * D) + Cf_d, Cw + Cf
+
+
+def design_flanged_beams(table):
+    """Design T and L beams for bending and vertical stirrups in one
+    vectorized pass, row for row equivalent to FlangedSection.Asc_Ast()
+    with bf from effective_flange_width(), followed by design_shear(). table
+    is a DataFrame, or a mapping of column names to arrays or scalars, with
+    columns
+
+    bw, D, df, l0, spacing, cover (clear cover), fck, fy, Mu, Vu and
+    optionally L_beam (False), cbar_dia (20), nlegs (2), vbar_dia (8) and
+    fyv (fy)
+
+    Bars are HYSD. The result has columns bf, d, xu, Mulim, Asc, Ast, tau_v,
+    tau_c and sv, as for design_beams()"""
+    (
+        bw,
+        D,
+        df,
+        l0,
+        spacing,
+        cover,
+        fck,
+        fy,
+        Mu,
+        Vu,
+        L_beam,
+        cbar_dia,
+        nlegs,
+        vbar_dia,
+        fyv,
+    ) = _columns(
+        table,
+        {
+            "bw": None,
+            "D": None,
+            "df": None,
+            "l0": None,
+            "spacing": None,
+            "cover": None,
+            "fck": None,
+            "fy": None,
+            "Mu": None,
+            "Vu": None,
+            "L_beam": 0.0,
+            "cbar_dia": 20.0,
+            "nlegs": 2.0,
+            "vbar_dia": 8.0,
+            "fyv": np.nan,
+        },
+    )
+    fyv = np.where(np.isnan(fyv), fy, fyv)
+    bf = np.asarray(effective_flange_width(l0, bw, df, spacing, L_beam != 0))
+    ecu = Concrete.ecu
+    dc = cover + cbar_dia / 2
+    d = D - dc
+    fd, fsd = 4 / 9 * fck, 100 / 115 * fy
+    xumax = ecu / (ecu + fsd / RebarHYSD.Es + RebarHYSD.es_offset) * d
+    Mulim, _ = _flanged_Mu_Cu(xumax, fd, bw, bf, D, d, df)
+    Mu_df, _ = _flanged_Mu_Cu(np.minimum(df, xumax), fd, bw, bf, D, d, df)
+    singly = Mu <= Mulim
+
+    # NA within the flange, rectangular section of width bf
+    c = 238 / 198
+    with np.errstate(invalid="ignore"):
+        xu = (c - np.sqrt(c**2 - 147 / 22 * Mu / (fck * bf * d**2))) * d
+    below = singly & (Mu > Mu_df)
+    if np.any(below):
+        xu[below] = flanged_reqd_xu(
+            Mu[below],
+            fd[below],
+            bw[below],
+            bf[below],
+            d[below],
+            df[below],
+            xumax[below],
+        )
+    xu = np.where(singly, xu, xumax)
+    _, Cu = _flanged_Mu_Cu(xu, fd, bw, bf, D, d, df)
+    Ast = Cu / fsd
+
+    # Doubly reinforced, FlangedSection.Asc_Ast()
+    Asc = np.zeros_like(Ast)
+    if not np.all(singly):
+        dbl = ~singly
+        esc = ecu / xumax[dbl] * (xumax[dbl] - dc[dbl])
+        fsc, fcc = _fsc_fcc(esc, fck[dbl], fy[dbl])
+        Asc[dbl] = (Mu[dbl] - Mulim[dbl]) / ((fsc - fcc) * (d[dbl] - dc[dbl]))
+        Ast[dbl] += Asc[dbl] * (fsc - fcc) / fsd[dbl]
+
+    tau_v, tau_c, sv = _stirrup_spacing(bw, d, Vu, Ast, fck, fyv, nlegs, vbar_dia)
+    result = {
+        "bf": bf,
+        "d": d,
+        "xu": xu,
+        "Mulim": Mulim,
+        "Asc": Asc,
+        "Ast": Ast,
+        "tau_v": tau_v,
+        "tau_c": tau_c,
+        "sv": sv,
+    }
+    return _with_columns(table, result)
+
+
+@dataclass
+class CostRates:
+    """Unit rates for sizing beams: concrete per m^3 by grade, steel per kg and
+    formwork per m^2"""
+
+    concrete: dict[float, float] = field(
+        default_factory=lambda: {20: 6000, 25: 6500, 30: 7000, 35: 7500, 40: 8000}
+    )
+    steel: float = 80.0
+    formwork: float = 600.0
+    density_steel: ClassVar[float] = 7850.0  # kg/m^3
+
+
+def size_beam(
+    Mu: float,
+    Vu: float,
+    b: tuple[float, ...] = (200, 230, 250, 300, 350, 400),
+    D: tuple[float, ...] = tuple(range(300, 901, 25)),
+    fck: tuple[float, ...] = (20, 25, 30),
+    dia: tuple[float, ...] = (12, 16, 20, 25),
+    fy: float = 415,
+    cover: float = 25,
+    vbar_dia: float = 8,
+    rates: CostRates | None = None,
+) -> dict[str, float]:
+    """Least cost singly reinforced rectangular section for Mu and Vu, among
+    all combinations of width b, overall depth D, concrete grade fck and
+    diameter dia of tension bars. Candidates are first pruned with the
+    bounds Mu <= Mulim and Vu <= tau_cmax b d, which need only b, d and the
+    grades, and the rest are designed together with design_beams(). cover is
+    the clear cover to the tension bars, as for d, and the bars must fit in
+    one layer by the spacing rule of bar_layout_table(). The
+    cost is per metre length of beam, for concrete, bars, stirrups and
+    formwork of the sides and soffit"""
+    rates = CostRates() if rates is None else rates
+    missing = [g for g in fck if float(g) not in rates.concrete]
+    if missing:
+        raise ValueError(
+            f"Error: No concrete rate for fck={missing}, rates are given for fck={sorted(rates.concrete)}"
+        )
+    grid = np.meshgrid(b, D, fck, dia, indexing="ij")
+    b, D, fck, dia = (np.ravel(a).astype(float) for a in grid)
+    n_candidates = len(b)
+
+    # Prune with bounds before designing
+    d = D - cover - dia / 2
+    fd, fsd = 4 / 9 * fck, 100 / 115 * fy
+    xumax_d = Concrete.ecu / (Concrete.ecu + fsd / RebarHYSD.Es + RebarHYSD.es_offset)
+    area1, _, xbar = csb_integrals(1.0, 0.0, 1.0)
+    Mulim_bd2 = fd * area1 * xumax_d * (1 - xbar * xumax_d)
+    keep = (Mu <= Mulim_bd2 * b * d**2) & (Vu <= tau_cmax_is456(fck) * b * d)
+    b, D, fck, dia = b[keep], D[keep], fck[keep], dia[keep]
+    n_designed = len(b)
+
+    r = design_beams(
+        {
+            "b": b,
+            "D": D,
+            "cover": cover,
+            "fck": fck,
+            "fy": fy,
+            "Mu": Mu,
+            "Vu": Vu,
+            "cbar_dia": dia,
+            "vbar_dia": vbar_dia,
+        }
+    )
+    # Tension bars provided in one layer, with clear cover to the bars as
+    # for d and bar_layout_table()
+    nbars = np.maximum(np.ceil(r["Ast"] / (np.pi * dia**2 / 4)), 2)
+    Ast = nbars * np.pi * dia**2 / 4
+    fits = _layer_fits(b - 2 * cover, nbars, dia) & ~np.isnan(r["sv"])
+    if not np.any(fits):
+        raise ValueError(f"Error: No section found for Mu={Mu} and Vu={Vu}")
+
+    concrete_rate = np.array([rates.concrete[float(v)] for v in fck])
+    Asv_length = (
+        2 * (b + D - 4 * (cover - vbar_dia)) * np.pi * vbar_dia**2 / 4 * 1000 / r["sv"]
+    )
+    steel = (Ast * 1000 + Asv_length) * 1e-9 * rates.density_steel
+    cost = (
+        b * D * 1e-6 * concrete_rate
+        + steel * rates.steel
+        + (b + 2 * D) * 1e-3 * rates.formwork
+    )
+    i = int(np.argmin(np.where(fits, cost, np.inf)))
+    return {
+        "b": float(b[i]),
+        "D": float(D[i]),
+        "fck": float(fck[i]),
+        "dia": float(dia[i]),
+        "nbars": int(nbars[i]),
+        "Ast": float(Ast[i]),
+        "sv": float(r["sv"][i]),
+        "cost": float(cost[i]),
+        "candidates": n_candidates,
+        "designed": n_designed,
+    }
+
+
+@dataclass(eq=False)
+class DesignCharts:
+    """SP16 style design charts of Mu / (b d^2) against pt for singly
+    reinforced rectangular sections, one chart per combination of concrete
+    grade fck[i] and steel grade fy[j]. pt[i, j] and Mu_bd2[i, j] are
+    increasing arrays of n points from zero to the limiting moment, so that
+    lookups are binary searches with linear interpolation"""
+
+    fck: NDArray
+    fy: NDArray
+    pt: NDArray
+    Mu_bd2: NDArray
+
+    def __post_init__(self):
+        self._fck = {float(v): i for i, v in enumerate(self.fck)}
+        self._fy = {float(v): j for j, v in enumerate(self.fy)}
+
+    @classmethod
+    def generate(
+        cls,
+        fck: tuple[float, ...] = (15, 20, 25, 30, 35, 40),
+        fy: tuple[float, ...] = (250, 415, 500),
+        n: int = 201,
+    ) -> "DesignCharts":
+        """Charts computed with RectBeamSection.Mu() at n values of xu from 0
+        to xumax. Mu / (b d^2) and pt do not depend on the size of section"""
+        pt = np.zeros((len(fck), len(fy), n))
+        Mu_bd2 = np.zeros((len(fck), len(fy), n))
+        for i, _fck in enumerate(fck):
+            for j, _fy in enumerate(fy):
+                steel = RebarMS(_fy) if _fy <= 250 else RebarHYSD(_fy)
+                sec = RectBeamSection(
+                    1000, 550, 40, Concrete(_fck), steel, steel, steel
+                )
+                bd, bd2 = sec.b * sec.d, sec.b * sec.d**2
+                for m, xu in enumerate(np.linspace(0, sec.xumax, n)[1:], 1):
+                    Mu = sec.Mu(xu)
+                    Ast = Mu / (steel.fd * (sec.d - sec.xbar() * xu))
+                    pt[i, j, m] = Ast * 100 / bd
+                    Mu_bd2[i, j, m] = Mu / bd2
+        return cls(np.array(fck, float), np.array(fy, float), pt, Mu_bd2)
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(
+            path, fck=self.fck, fy=self.fy, pt=self.pt, Mu_bd2=self.Mu_bd2
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "DesignCharts":
+        with np.load(path) as data:
+            return cls(data["fck"], data["fy"], data["pt"], data["Mu_bd2"])
+
+    def chart(self, fck: float, fy: float) -> tuple[NDArray, NDArray]:
+        """pt and Mu / (b d^2) of the chart for grades fck and fy"""
+        try:
+            i, j = self._fck[float(fck)], self._fy[float(fy)]
+        except KeyError:
+            raise ValueError(f"Error: No design chart for fck={fck} fy={fy}")
+        return self.pt[i, j], self.Mu_bd2[i, j]
+
+    def Mulim_bd2(self, fck: float, fy: float) -> float:
+        return float(self.chart(fck, fy)[1][-1])
+
+    def reqd_pt(
+        self, fck: float, fy: float, Mu_bd2: float | NDArray
+    ) -> float | NDArray:
+        """Percentage of tension steel for Mu / (b d^2), which may be an array.
+        nan where Mu / (b d^2) exceeds the limiting value"""
+        pt, Mu = self.chart(fck, fy)
+        return np.interp(Mu_bd2, Mu, pt, right=np.nan)
+
+    def Mu_bd2_pt(self, fck: float, fy: float, pt: float | NDArray) -> float | NDArray:
+        """Mu / (b d^2) for pt, which may be an array. nan where pt exceeds
+        the limiting percentage"""
+        _pt, Mu = self.chart(fck, fy)
+        return np.interp(pt, _pt, Mu, right=np.nan)
+
+    def check(self, n: int = 50) -> float:
+        """Largest relative difference between pt from the charts and from
+        RectBeamSection.reqd_Ast() at n moments of each chart, ranging up to
+        the limiting moment"""
+        err = 0.0
+        for fck in self.fck:
+            for fy in self.fy:
+                steel = RebarMS(fy) if fy <= 250 else RebarHYSD(fy)
+                sec = RectBeamSection(300, 600, 30, Concrete(fck), steel, steel, steel)
+                bd, bd2 = sec.b * sec.d, sec.b * sec.d**2
+                for Mu_bd2 in np.linspace(0, self.Mulim_bd2(fck, fy), n + 1)[1:]:
+                    pt = sec.reqd_Ast(Mu_bd2 * bd2) * 100 / bd
+                    err = max(err, abs(self.reqd_pt(fck, fy, Mu_bd2) - pt) / pt)
+        return err
+
+
+def _cache_dir() -> Path:
+    """Per-user directory for generated charts, under $XDG_CACHE_HOME or
+    ~/.cache"""
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "rcd_bending_rect"
+
+
+@lru_cache(maxsize=None)
+def design_charts(path: str | Path | None = None) -> DesignCharts:
+    """Design charts loaded from path, generated and saved there first if the
+    file does not exist. path defaults to design_charts.npz in the per-user
+    cache directory"""
+    path = _cache_dir() / "design_charts.npz" if path is None else Path(path)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        DesignCharts.generate().save(path)
+    return DesignCharts.load(path)
+
+
 @dataclass
 class RectColumnSection:
     b: float
@@ -711,12 +2165,12 @@ class RectColumnSection:
             es_max = self.conc.ecu
         else:
             z1 = k - 1
-            es_max = self.conc.ecy * k / (k - F(3, 7))
+            es_max = self.conc.ecy * k / (k - self.conc.k_pivot)
         z2 = k
         if report:
             data["es_max"] = es_max
 
-        csb = CSB(k)
+        csb = self.conc.stress_block(k)
         Ac = csb.area(z1, z2)
         Pc = Ac * self.conc.fd * self.D * self.b
         Mc = csb.moment(z1, z2) * self.conc.fd * self.D**2 * self.b
@@ -731,9 +2185,8 @@ class RectColumnSection:
         x1 = xu - self.D + self.dc
         As2 = As1
         x2 = xu - self.dc
-        xy = xu - self.D * 3 / 7
-        es1 = self.conc.ecy * x1 / xy
-        es2 = self.conc.ecy * x2 / xy
+        es1 = es_max * x1 / xu
+        es2 = es_max * x2 / xu
 
         # Highly compressed bars
         fs1 = self.steel.fs(es1)
@@ -770,7 +2223,75 @@ class RectColumnSection:
 
         return Pu, Mu, data
 
-    def design_column_xu(self, Pu: float, Mu: float, ps: float | None = None) -> float:
+    def _Pu_Mu_parts(self, xu: NDArray) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Pc, Mc, Ps and Ms for an array of NA depths xu, such that
+        P = Pc + total_As * Ps and -P * e = Mc + total_As * Ms, with e measured
+        from mid-depth as in Pu_Mu(), where e < 0 when Mu > 0"""
+        xu = np.asarray(xu, dtype=float)
+        k = xu / self.D
+        z1 = np.maximum(k - 1, 0.0)
+        # Constants as float, as they are Fractions in the EXACT backend
+        ecy, ecu, fd = float(self.conc.ecy), float(self.conc.ecu), float(self.conc.fd)
+        with np.errstate(divide="ignore"):
+            es_max = np.where(k <= 1, ecu, ecy * k / (k - float(self.conc.k_pivot)))
+        Ac, Mc, _ = self.conc.block_integrals(k, z1, k)
+        Pc = np.asarray(Ac, dtype=float) * fd * self.D * self.b
+        Mc = np.asarray(Mc, dtype=float) * fd * self.D**2 * self.b
+
+        # Bars at the least and the highly compressed edges, per unit total_As
+        x = np.stack((xu - self.D + self.dc, xu - self.dc))
+        es = es_max * x / xu
+        Ps = (self.steel.fs(es) - self.conc.fc(es)) / 2
+
+        # Moments about mid-depth of section
+        a = xu - self.D / 2
+        return Pc, Mc - Pc * a, Ps.sum(axis=0), (Ps * (x - a)).sum(axis=0)
+
+    def Pu_Mu_array(self, xu: NDArray) -> tuple[NDArray, NDArray]:
+        """Pu and Mu as from Pu_Mu() for an array of NA depths xu, evaluated
+        together. self.xu is not changed"""
+        Pc, Mc, Ps, Ms = self._Pu_Mu_parts(xu)
+        P = Pc + self.total_As * Ps
+        e = (Mc + self.total_As * Ms) / P
+        return P, P * np.abs(e)
+
+    def Pu0(self) -> float:
+        """Pu for uniform strain ecy over the section, the limit of Pu_Mu() as
+        xu tends to infinity, when Mu is zero"""
+        fs = float(self.steel.fs(self.conc.ecy))
+        fc = float(self.conc.fd)
+        return fc * self.b * self.D + self.total_As * (fs - fc)
+
+    def interaction_curve(
+        self, n_points: int = 100, k_min: float = 0.05, k_max: float = 5.0
+    ) -> tuple[NDArray, NDArray, NDArray]:
+        """Interaction curve as arrays xu, Pu and Mu of n_points points, with
+        k = xu / D from k_min, where bars at the least compressed edge are in
+        tension, to k_max, followed by pure axial compression Pu0() at
+        xu = inf. Half of the points lie within k <= 1"""
+        n1 = n_points // 2
+        k = np.concatenate(
+            (
+                np.linspace(k_min, 1, n1),
+                np.geomspace(1, k_max, n_points - n1)[1:],
+            )
+        )
+        xu = k * self.D
+        Pu, Mu = self.Pu_Mu_array(xu)
+        return (
+            np.append(xu, np.inf),
+            np.append(Pu, self.Pu0()),
+            np.append(Mu, 0.0),
+        )
+
+    def design_column_xu(
+        self,
+        Pu: float,
+        Mu: float,
+        ps: float | None = None,
+        method: str = "brent",
+        stats: SolverStats | None = None,
+    ) -> float:
         def find_e(xu: float, **kwargs) -> float:
             e_reqd = kwargs["e_reqd"]
             Pu_calc, Mu_calc, _ = self.Pu_Mu(xu)
@@ -787,16 +2308,26 @@ class RectColumnSection:
         print(
             f"{Pu1 / 1e3:.2f} kN, {Mu1 / 1e6:.2f} kNm, e={e1:.3f} e_reqd={e_reqd:.3f}"
         )
-        if e_reqd < e1:  # Increase xu
+        if e_reqd < e1:  # Increase xu, e decreases monotonically with xu
             xu2 = self.D * 6
+            monotonic = True
         else:  # Decrease xu
             xu2 = xu1
             xu1 = self.dc
-        n = int((xu2 - xu1) / 5)
-        xu1, xu2 = find_bracket(find_e, xu1, xu2, n, e_reqd=e_reqd)
+            monotonic = False
+        xu1, xu2 = find_bracket_adaptive(
+            find_e, xu1, xu2, monotonic=monotonic, stats=stats, e_reqd=e_reqd
+        )
         print(f"Bracket: {xu1=} {xu2=}")
-        # xu_reqd = brent_root(find_e, xu1, xu2, max_iter=30, tol=1e-3, e_reqd=e_reqd)
-        xu_reqd = bisection(find_e, xu1, xu2, max_iter=50, tol=1e-3, e_reqd=e_reqd)
+        xu_reqd = solve(
+            find_e,
+            (xu1, xu2),
+            method,
+            max_iter=50,
+            tol=1e-9,
+            stats=stats,
+            e_reqd=e_reqd,
+        )
         self.xu = xu_reqd
         return xu_reqd
 
@@ -830,25 +2361,274 @@ class RectColumnSection:
         ps_reqd = bisection(find_ps, p1, p2, max_iter=50, tol=1e-3, Pu=Pu, Mu=Mu)
         return ps_reqd
 
-    def design_column(self, Pu: float, Mu: float) -> float:
-        ps = 2.0
-        xu_reqd = self.design_column_xu(Pu, Mu, ps)
-        ps_reqd = self.design_column_ps(Pu, Mu, xu_reqd)
-        Pu_calc, Mu_calc, _ = self.Pu_Mu(xu_reqd)
-        print(
-            f"xu={xu_reqd:.2f}, ps={ps_reqd:.2f}, {Pu_calc / 1e3:.2f}, {Mu_calc / 1e6:.2f} e_reqd={Mu / Pu:.2f} e_calc={Mu_calc / Pu_calc:.2f}"
-        )
-        print(
-            f"{Pu / 1e3:.2f}, {Mu / 1e6:.2f}, {(Pu_calc - Pu) / Pu}, {(Mu_calc - Mu) / Mu}"
+    def design_column_newton(
+        self,
+        Pu: float,
+        Mu: float,
+        xu: float | None = None,
+        ps: float | None = None,
+        max_iter: int = 50,
+        tol: float = 1e-10,
+        stats: SolverStats | None = None,
+    ) -> tuple[float, float]:
+        """Solve Pu_Mu(xu) = (Pu, Mu) for xu and the steel percentage ps
+        together by Newton's method, and return (xu, ps). The equations are
+        scaled by fck b D and fck b D^2. They are linear in ps, so its
+        derivatives are exact, and those with respect to xu are central
+        differences. Steps are halved until the residual decreases. Unless
+        given, xu starts at the best of the NA depths of interaction_curve(),
+        with ps satisfying Pu. When concrete alone is adequate, ps is 0 and
+        stats.reason is "bound". Sets xu and total_As"""
+        if Pu <= 0 or Mu < 0:
+            raise ValueError(
+                "Error: design_column_newton() requires Pu > 0 and Mu >= 0"
+            )
+        # The iteration is in float whatever the numeric backend
+        Pu, Mu = float(Pu), float(Mu)
+        b, D = float(self.b), float(self.D)
+        P1 = float(self.conc.fck) * b * D  # Scale for forces
+        As1 = b * D / 100  # total_As for ps = 1
+
+        if Mu == 0:  # Pure axial compression, xu = inf
+            fs = float(self.steel.fs(self.conc.ecy))
+            fd = float(self.conc.fd)
+            ps = max((Pu - fd * b * D) / (fs - fd) / As1, 0.0)
+            self.xu = math.inf
+            self.total_As = ps * As1
+            return self.xu, ps
+
+        def parts(k: NDArray) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+            Pc, Mc, Ps, Ms = self._Pu_Mu_parts(k * D)
+            return (
+                (Pc - Pu) / P1,
+                (Mc - Mu) / (P1 * D),
+                Ps * As1 / P1,
+                Ms * As1 / (P1 * D),
+            )
+
+        def residual(k: float, p: float) -> tuple[NDArray, NDArray]:
+            r1, r2, a1, a2 = parts(np.array([k]))
+            a = np.array([a1[0], a2[0]])
+            return np.array([r1[0], r2[0]]) + p * a, a
+
+        def jacobian(u: tuple[float, float], a: NDArray) -> NDArray:
+            k, p = u
+            r1, r2, a1, a2 = parts(np.array([k - h, k + h]))
+            dk = np.array(
+                [
+                    r1[1] - r1[0] + p * (a1[1] - a1[0]),
+                    r2[1] - r2[0] + p * (a2[1] - a2[0]),
+                ]
+            ) / (2 * h)
+            return np.column_stack((dk, a))
+
+        if stats is not None:
+            parts = stats.start(parts)
+            jacobian = stats.derivative(jacobian)
+
+        h = 1e-6
+        k_lo, k_hi = 1e-3, 100.0
+
+        # NA depths of interaction_curve(), with ps satisfying Pu at each
+        kg = np.concatenate((np.linspace(0.05, 1, 50), np.geomspace(1, 5, 51)[1:]))
+        r1, r2, a1, a2 = parts(kg)
+
+        # Capacity of concrete alone where its interaction curve meets the
+        # line Mu = e Pu, if they meet. e decreases monotonically with xu
+        # where Pu > 0
+        P0, M0 = r1 + Pu / P1, r2 + Mu / (P1 * D)
+        comp = P0 > 0
+        e0 = (M0[comp] / P0[comp])[::-1]
+        e = Mu / (Pu * D)
+        if np.interp(e, e0, P0[comp][::-1], right=0.0) >= Pu / P1:
+            self.xu = float(np.interp(e, e0, kg[comp][::-1])) * D
+            self.total_As = 0.0
+            if stats is not None:
+                stats.stop("bound")
+            return self.xu, 0.0
+
+        pg = -r1 / a1
+        i = np.argmin(np.where(pg >= 0, np.abs(r2 + pg * a2), np.inf))
+        k = kg[i] if xu is None else xu / D
+        res, a = residual(k, 0.0)
+        p = -res[0] / a[0] if ps is None else ps
+        res = res + p * a
+        for _ in range(max_iter):
+            norm = np.abs(res).max()
+            if norm <= tol:
+                self.xu = k * D
+                self.total_As = p * As1
+                if stats is not None:
+                    stats.stop("ftol")
+                return self.xu, p
+            J = jacobian((k, p), a=a)
+            det = J[0, 0] * J[1, 1] - J[0, 1] * J[1, 0]
+            if det == 0:
+                if stats is not None:
+                    stats.stop("singular")
+                raise ValueError(
+                    f"Error: design_column_newton() singular Jacobian at xu={k * D}"
+                )
+            dk = (res[0] * J[1, 1] - res[1] * J[0, 1]) / det
+            dp = (J[0, 0] * res[1] - J[1, 0] * res[0]) / det
+            t = 1.0
+            while True:
+                k_new = min(max(k - t * dk, k_lo), k_hi)
+                p_new = p - t * dp
+                res_new, a_new = residual(k_new, p_new)
+                if np.abs(res_new).max() < norm or t < 1 / 64:
+                    break
+                t /= 2
+            k, p, res, a = k_new, p_new, res_new, a_new
+            if stats is not None:
+                stats.step(norm)
+
+        if stats is not None:
+            stats.stop("max_iter")
+        raise ValueError(
+            f"Error: design_column_newton() did not converge after {max_iter} iterations"
         )
-        while abs(Pu_calc - Pu) / Pu > 1e-2 or abs(Mu_calc - Mu) / Mu > 1e-4:
-            print("---")
-            xu_reqd = self.design_column_xu(Pu, Mu, ps_reqd)
-            ps_reqd = self.design_column_ps(Pu, Mu, xu_reqd)
-            Pu_calc, Mu_calc, _ = self.Pu_Mu(xu_reqd)
-            print(
-                f"xu={xu_reqd:.2f}, ps={ps_reqd:.2f}, {Pu_calc / 1e3:.2f}, {Mu_calc / 1e6:.2f} e_reqd={Mu / Pu:.2f} e_calc={Mu_calc / Pu_calc:.2f}"
+
+    def design_column(
+        self,
+        Pu: float,
+        Mu: float,
+        charts: "ColumnCharts | None" = None,
+        stats: SolverStats | None = None,
+    ) -> float:
+        """Steel percentage ps for Pu and Mu, interpolated from charts if
+        given, else from design_column_newton(). Sets total_As"""
+        if charts is not None:
+            ps = charts.reqd_ps(
+                self.conc.fck,
+                self.steel.fy,
+                self.dc / self.D,
+                Pu / (self.conc.fck * self.b * self.D),
+                Mu / (self.conc.fck * self.b * self.D**2),
             )
+            self.total_As = ps / 100 * self.b * self.D
+            return ps
+
+        _, ps = self.design_column_newton(Pu, Mu, stats=stats)
+        ps = max(ps, 0.0)
+        self.total_As = ps / 100 * self.b * self.D
+        return ps
+
+
+@dataclass(eq=False)
+class ColumnCharts:
+    """Non-dimensional interaction charts of Pu / (fck b D) and
+    Mu / (fck b D^2) for rectangular columns with equal steel at two faces,
+    keyed by fck, fy, d'/D (dD) and p / fck (pf). curves[i, j, l, m] holds
+    the points (Pu, Mu) of the chart for fck[i], fy[j], dD[l] and pf[m],
+    from pure bending (Pu = 0) along RectColumnSection.interaction_curve()
+    to pure axial compression. curves may be a read-only memory map, so
+    that only the charts used are read from disk"""
+
+    fck: NDArray
+    fy: NDArray
+    dD: NDArray
+    pf: NDArray
+    curves: NDArray
+
+    @classmethod
+    def generate(
+        cls,
+        fck: tuple[float, ...] = (20, 25, 30, 35, 40),
+        fy: tuple[float, ...] = (415, 500),
+        dD: tuple[float, ...] = (0.05, 0.10, 0.15, 0.20),
+        pf: tuple[float, ...] = tuple(np.round(np.arange(0, 0.261, 0.02), 2)),
+        n_points: int = 100,
+    ) -> "ColumnCharts":
+        curves = np.zeros((len(fck), len(fy), len(dD), len(pf), n_points + 1, 2))
+        for i, _fck in enumerate(fck):
+            conc = Concrete(_fck)
+            for j, _fy in enumerate(fy):
+                steel = RebarHYSD(_fy)
+                for idd, _dD in enumerate(dD):
+                    for m, _pf in enumerate(pf):
+                        As = _pf * _fck / 100 * 1000 * 1000
+                        col = RectColumnSection(1000, 1000, _dD * 1000, conc, steel, As)
+                        xu, Pu, _ = col.interaction_curve(n_points)
+                        # Moments with sign, continuous where Pu changes sign
+                        _, Mc, _, Ms = col._Pu_Mu_parts(xu[:-1])
+                        Mu = np.append(Mc + As * Ms, 0.0)
+                        # Pure bending, where Pu first becomes positive. Plain
+                        # concrete reaches it only as xu tends to 0
+                        k = int(np.argmax(Pu > 0))
+                        Mu0 = 0.0
+                        if k > 0:
+                            t = -Pu[k - 1] / (Pu[k] - Pu[k - 1])
+                            Mu0 = Mu[k - 1] + t * (Mu[k] - Mu[k - 1])
+                        Pu[:k], Mu[:k] = 0.0, Mu0
+                        curve = curves[i, j, idd, m]
+                        curve[0] = 0.0, Mu0 / (_fck * 1000 * 1000**2)
+                        curve[1:, 0] = Pu / (_fck * 1000 * 1000)
+                        curve[1:, 1] = Mu / (_fck * 1000 * 1000**2)
+        return cls(*(np.array(a, float) for a in (fck, fy, dD, pf)), curves)
+
+    def save(self, path: str | Path) -> None:
+        """Save to directory path as keys.npz and curves.npy"""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.savez(path / "keys.npz", fck=self.fck, fy=self.fy, dD=self.dD, pf=self.pf)
+        np.save(path / "curves.npy", self.curves)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ColumnCharts":
+        path = Path(path)
+        with np.load(path / "keys.npz") as keys:
+            fck, fy, dD, pf = (keys[k] for k in ("fck", "fy", "dD", "pf"))
+        return cls(fck, fy, dD, pf, np.load(path / "curves.npy", mmap_mode="r"))
+
+    def capacity(self, i: int, j: int, idd: int, e: float) -> NDArray:
+        """Pu / (fck b D) of the charts for every pf, where they meet the line
+        Mu / Pu = e * D, or 0 where they do not. The charts are polylines
+        from pure bending to pure axial compression"""
+        Pu, Mu = self.curves[i, j, idd, ..., 0], self.curves[i, j, idd, ..., 1]
+        # Side of the line, positive below it, 0 at pure bending of concrete
+        c = Mu - e * Pu
+        below = c[:, 1:] > 0
+        k = 1 + np.argmax(~below, axis=1)  # First point on or above the line
+        m = np.arange(len(self.pf))
+        t = c[m, k - 1] / (c[m, k - 1] - c[m, k])
+        Pu_cap = Pu[m, k - 1] + t * (Pu[m, k] - Pu[m, k - 1])
+        return np.where(below.all(axis=1), 0.0, Pu_cap)
+
+    def reqd_ps(
+        self, fck: float, fy: float, dD: float, Pu_n: float, Mu_n: float
+    ) -> float:
+        """Steel percentage for Pu / (fck b D) = Pu_n and Mu / (fck b D^2) =
+        Mu_n, interpolated between the charts for p / fck and d'/D"""
+        try:
+            i = list(self.fck).index(fck)
+            j = list(self.fy).index(fy)
+        except ValueError:
+            raise ValueError(f"Error: No column charts for fck={fck} fy={fy}")
+        if not self.dD[0] <= dD <= self.dD[-1]:
+            raise ValueError(f"Error: d'/D = {dD} outside the column charts")
+        if Pu_n <= 0:
+            raise ValueError("Error: Column charts need Pu > 0")
+        idd = min(int(np.searchsorted(self.dD, dD, side="right")) - 1, len(self.dD) - 2)
+        w = (dD - self.dD[idd]) / (self.dD[idd + 1] - self.dD[idd])
+        e = Mu_n / Pu_n
+        Pu_cap = (1 - w) * self.capacity(i, j, idd, e) + w * self.capacity(
+            i, j, idd + 1, e
+        )
+        if Pu_n > Pu_cap[-1]:
+            raise ValueError(f"Error: p/fck exceeds {self.pf[-1]} of the column charts")
+        return float(np.interp(Pu_n, Pu_cap, self.pf)) * fck
+
+
+@lru_cache(maxsize=None)
+def column_charts(path: str | Path | None = None) -> ColumnCharts:
+    """Column charts from directory path, generated and saved there first if
+    it does not exist. path defaults to column_charts in the per-user cache
+    directory. Curves are memory mapped and read as they are used"""
+    path = _cache_dir() / "column_charts" if path is None else Path(path)
+    if not (path / "curves.npy").exists():
+        ColumnCharts.generate().save(path)
+    return ColumnCharts.load(path)
 
 
 if __name__ == "__main__":
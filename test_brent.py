@@ -0,0 +1,277 @@
+import math
+
+import numpy as np
+import pytest
+
+from brent import (
+    Continuation,
+    SolverStats,
+    brent_root,
+    brent_root_batch,
+    find_all_brackets,
+    find_all_roots,
+    find_bracket,
+    find_bracket_adaptive,
+    newton_safe,
+    solve,
+    sweep,
+)
+
+
+# Functions with a root in the bracket, and the root
+BRENT_CASES = [
+    (lambda x: x**3 - 2 * x - 5, 2.0, 3.0, 2.0945514815423265),
+    (lambda x: math.cos(x) - x, 0.0, 1.0, 0.7390851332151607),
+    (lambda x: math.exp(x) - 1e3, 0.0, 10.0, math.log(1e3)),
+    (lambda x: x * math.exp(x) - 1, -1.0, 2.0, 0.5671432904097838),
+    (lambda x: math.atan(x - 0.3), -5.0, 10.0, 0.3),
+    (lambda x: (x - 1) ** 9, 0.0, 3.0, 1.0),
+]
+
+
+@pytest.mark.parametrize("f, x1, x2, root", BRENT_CASES)
+def test_brent_root(f, x1, x2, root):
+    stats = SolverStats()
+    x = brent_root(f, x1, x2, max_iter=200, tol=1e-12, stats=stats)
+    assert x == pytest.approx(root, abs=1e-9)
+    assert stats.reason in ("root", "xtol")
+    # Never much slower than bisection, which halves the bracket each step
+    assert stats.niter <= 3 * math.ceil(math.log2(abs(x2 - x1) / 1e-12))
+
+
+@pytest.mark.parametrize("f, x1, x2, root", BRENT_CASES)
+def test_brent_root_reversed_bracket(f, x1, x2, root):
+    assert brent_root(f, x2, x1, max_iter=200) == pytest.approx(root, abs=1e-9)
+
+
+def test_brent_root_bracket_invariant():
+    # Every iterate stays inside the initial bracket
+    xs = []
+
+    def f(x):
+        xs.append(x)
+        return x**3 - 2 * x - 5
+
+    brent_root(f, 2.0, 3.0)
+    assert all(2.0 <= x <= 3.0 for x in xs)
+
+
+def test_brent_root_no_bracket():
+    with pytest.raises(ValueError):
+        brent_root(lambda x: x**2 + 1, -1.0, 1.0)
+
+
+def test_brent_root_batch_matches_scalar():
+    def f(x, a, c):
+        return a * x**2 - 3 * x + c
+
+    a = np.array([2.0, 1.0, 0.5, 3.0])
+    c = np.array([-4.0, -1.0, -10.0, -0.1])
+    x = brent_root_batch(f, 0.0, 10.0, a=a, c=c)
+    expected = [brent_root(f, 0.0, 10.0, a=ai, c=ci) for ai, ci in zip(a, c)]
+    assert x.shape == a.shape
+    assert x == pytest.approx(expected, abs=1e-11)
+    assert f(x, a, c) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_brent_root_batch_root_at_endpoint():
+    x = brent_root_batch(lambda x: x - 1.0, [1.0, 0.0], [2.0, 1.0])
+    assert x.tolist() == [1.0, 1.0]
+
+
+def test_brent_root_batch_no_bracket():
+    with pytest.raises(ValueError):
+        brent_root_batch(lambda x: x**2 - 1, [0.0, 2.0], [2.0, 3.0])
+
+
+def test_find_bracket_adaptive_refines_near_miss():
+    # Two close roots at 0.3 -+ 0.001 that the coarse scan steps over
+    def f(x):
+        return (x - 0.3) ** 2 - 1e-6
+
+    stats = SolverStats()
+    x1, x2 = find_bracket_adaptive(f, 0.0, 1.0, stats=stats)
+    assert f(x1) * f(x2) < 0
+    assert x1 <= 0.299 <= x2
+    assert stats.reason == "bracket"
+    # A uniform scan needs hundreds of divisions to find the same bracket
+    assert stats.nfev < 100
+    assert find_bracket(f, 0.0, 1.0, 1000) == pytest.approx((0.299, 0.3))
+
+
+def test_find_bracket_adaptive_monotonic():
+    stats = SolverStats()
+    assert find_bracket_adaptive(
+        lambda x: x - 0.3, 0.0, 1.0, monotonic=True, stats=stats
+    ) == (0.0, 1.0)
+    assert stats.nfev == 2
+
+
+@pytest.mark.parametrize("x_root", [0.0, 1.0])
+def test_find_bracket_adaptive_root_at_endpoint(x_root):
+    assert find_bracket_adaptive(lambda x: x - x_root, 0.0, 1.0) == (x_root, x_root)
+
+
+@pytest.mark.parametrize("monotonic", [False, True])
+def test_find_bracket_adaptive_no_root(monotonic):
+    with pytest.raises(ValueError):
+        find_bracket_adaptive(lambda x: x**2 + 1, -1.0, 1.0, monotonic=monotonic)
+
+
+def test_solver_stats_counts_evaluations():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return x**3 - 2 * x - 5
+
+    stats = SolverStats()
+    x1, x2 = find_bracket(f, 0.0, 5.0, 10, stats=stats)
+    brent_root(f, x1, x2, stats=stats)
+    assert stats.nfev == len(calls)
+    assert stats.niter == len(stats.widths) > 0
+    assert stats.reason in ("root", "xtol")
+    assert stats.elapsed > 0
+    # Widths of a bracketing solver never grow
+    assert all(w2 <= w1 for w1, w2 in zip(stats.widths[:-1], stats.widths[1:]))
+
+
+def test_solver_stats_records_failure():
+    stats = SolverStats()
+    with pytest.raises(ValueError):
+        brent_root(lambda x: (x - 1) ** 9, 0.0, 3.0, max_iter=5, stats=stats)
+    assert stats.reason == "max_iter"
+    assert stats.niter == 5
+
+
+@pytest.mark.parametrize("method", ["brent", "bisection", "chandrupatla", "itp"])
+@pytest.mark.parametrize("f, x1, x2, root", BRENT_CASES[:5])
+def test_solve_methods(method, f, x1, x2, root):
+    stats = SolverStats()
+    x = solve(f, (x1, x2), method, stats=stats)
+    assert x == pytest.approx(root, abs=1e-10)
+    if method == "bisection":
+        # tol is a tolerance on the bracket width, not on |f|
+        assert stats.reason == "xtol" or f(x) == 0
+
+
+def test_solve_newton():
+    x = solve(
+        lambda x: x**3 - 2 * x - 5, (2.0, 3.0), "newton", fprime=lambda x: 3 * x**2 - 2
+    )
+    assert x == pytest.approx(2.0945514815423265, abs=1e-12)
+
+
+def test_solve_root_bracket():
+    assert solve(lambda x: x, (0.0, 0.0), "itp") == 0.0
+
+
+def test_solve_unknown_method():
+    with pytest.raises(ValueError, match="unknown method"):
+        solve(lambda x: x, (-1.0, 1.0), "secant")
+
+
+def quadratic(x, a, b, c):
+    return a * x**2 + b * x + c
+
+
+def test_sweep_matches_cold_solves():
+    c = np.linspace(-10.0, -1.0, 10)
+    stats = SolverStats()
+    x = sweep(quadratic, c, 0.0, 10.0, "c", stats=stats, a=2.0, b=-3.0)
+    expected = (3 + np.sqrt(9 - 8 * c)) / 4
+    assert x == pytest.approx(expected, abs=1e-11)
+
+    cold = SolverStats()
+    for ci in c:
+        x1, x2 = find_bracket_adaptive(
+            quadratic, 0.0, 10.0, stats=cold, a=2.0, b=-3.0, c=ci
+        )
+        brent_root(quadratic, x1, x2, stats=cold, a=2.0, b=-3.0, c=ci)
+    assert stats.nfev < cold.nfev
+
+
+def test_continuation_warm_start():
+    cont = Continuation(quadratic, 0.0, 10.0, "c")
+    assert cont.guess(-4.0) is None
+    cont.solve(-4.0, a=2.0, b=-3.0)
+    cont.solve(-5.0, a=2.0, b=-3.0)
+    assert cont.values == [-4.0, -5.0]
+
+    # Linear extrapolation from the last two roots
+    x0, _ = cont.guess(-6.0)
+    slope = (cont.roots[1] - cont.roots[0]) / (-5.0 - -4.0)
+    assert x0 == pytest.approx(cont.roots[1] + slope * (-6.0 - -5.0))
+    assert cont.solve(-6.0, a=2.0, b=-3.0) == pytest.approx((3 + np.sqrt(57)) / 4)
+
+
+def test_continuation_root_jump():
+    # The warm bracket search steps out to a root far from the guess
+    def f(x, p):
+        return np.tanh(20 * (x - p))
+
+    cont = Continuation(f, 0.0, 10.0, "p", monotonic=True)
+    assert cont.solve(1.0) == pytest.approx(1.0)
+    assert cont.solve(9.0) == pytest.approx(9.0)
+
+
+@pytest.mark.parametrize("halley", [False, True])
+def test_newton_safe(halley):
+    stats = SolverStats()
+    x = newton_safe(
+        lambda x: x**3 - 2 * x - 5,
+        2.0,
+        3.0,
+        lambda x: 3 * x**2 - 2,
+        (lambda x: 6 * x) if halley else None,
+        stats=stats,
+    )
+    assert x == pytest.approx(2.0945514815423265, abs=1e-12)
+    assert stats.niter <= (4 if halley else 6)
+    assert stats.ndev > 0
+
+
+def test_newton_safe_falls_back_to_bisection():
+    # Newton's method alone cycles between -1 and 1 from x = 1 on atan
+    stats = SolverStats()
+    x = newton_safe(math.atan, -1.0, 10.0, lambda x: 1 / (1 + x**2), stats=stats)
+    assert x == pytest.approx(0.0, abs=1e-12)
+    assert stats.reason in ("root", "xtol", "ftol")
+
+
+def test_newton_safe_no_bracket():
+    with pytest.raises(ValueError):
+        newton_safe(lambda x: x**2 + 1, -1.0, 1.0, lambda x: 2 * x)
+
+
+@pytest.mark.parametrize("n", [4, 7, 100])
+def test_find_all_roots_polynomial(n):
+    # With n = 4 the roots fall exactly on grid points
+    def f(x):
+        return (x - 1) * (x - 2) * (x - 3)
+
+    assert find_all_roots(f, 0.0, 4.0, n) == pytest.approx([1.0, 2.0, 3.0], abs=1e-12)
+
+
+def test_find_all_roots_trigonometric():
+    x = find_all_roots(lambda x: np.sin(x) - 0.5 * np.cos(3 * x), -np.pi, np.pi)
+    assert np.all(np.diff(x) > 0)
+    assert np.sin(x) - 0.5 * np.cos(3 * x) == pytest.approx(0.0, abs=1e-10)
+    # f changes sign at each root and nowhere else on a fine grid
+    xx = np.linspace(-np.pi, np.pi, 100001)
+    yy = np.sin(xx) - 0.5 * np.cos(3 * xx)
+    assert x.size == np.count_nonzero(yy[:-1] * yy[1:] < 0)
+
+
+def test_find_all_roots_none():
+    stats = SolverStats()
+    assert find_all_roots(lambda x: x**2 + 1, -1.0, 1.0, stats=stats).size == 0
+    assert stats.reason == "no_bracket"
+
+
+def test_find_all_brackets_single_evaluation():
+    stats = SolverStats()
+    x1, x2 = find_all_brackets(lambda x: np.cos(x), 0.0, 10.0, 50, stats=stats)
+    assert stats.nfev == 1
+    assert x1 == pytest.approx(np.array([1, 3, 5]) * np.pi / 2, abs=0.2)
+    assert x2 - x1 == pytest.approx(np.full(3, 0.2))
@@ -0,0 +1,582 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from brent import SOLVERS, SolverStats
+
+from rcd_bending_rect import (
+    ColumnCharts,
+    DesignCharts,
+    CSB,
+    Concrete,
+    FlangedSection,
+    NumericBackend,
+    RebarHYSD,
+    RectBeamSection,
+    RebarLayers,
+    RebarMS,
+    RectColumnSection,
+    ShearReinforcementType,
+    Stirrups,
+    TabulatedConcrete,
+    bar_layout_table,
+    column_charts,
+    csb_integrals,
+    design_beams,
+    design_charts,
+    design_flanged_beams,
+    effective_flange_width,
+    hysd_curve,
+    numeric_backend,
+    size_beam,
+    slab_k_is456,
+    tau_c_is456,
+    tau_cmax_is456,
+)
+
+
+@pytest.fixture(scope="module")
+def M20():
+    return Concrete(20)
+
+
+@pytest.fixture(scope="module")
+def Fe500():
+    return RebarHYSD(500)
+
+
+@pytest.fixture(scope="module")
+def Fe415():
+    return RebarHYSD(415)
+
+
+@pytest.fixture(scope="module")
+def column_charts_M20(tmp_path_factory):
+    path = tmp_path_factory.mktemp("column_charts")
+    ColumnCharts.generate(fck=(20,), fy=(500,)).save(path)
+    return ColumnCharts.load(path)
+
+
+@pytest.mark.parametrize(
+    "Pu, Mu",
+    [(50e3, 180e6), (20e3, 100e6), (10e3, 50e6), (100e3, 150e6), (1200e3, 150e6)],
+)
+def test_column_charts_large_eccentricity(column_charts_M20, M20, Fe500, Pu, Mu):
+    col = RectColumnSection(300, 500, 50, M20, Fe500, 0.0)
+    ps_newton = col.design_column(Pu, Mu)
+    ps_chart = col.design_column(Pu, Mu, charts=column_charts_M20)
+    assert ps_chart > 0
+    assert ps_chart == pytest.approx(ps_newton, rel=0.02)
+
+
+def test_column_charts_beyond_range(column_charts_M20, M20, Fe500):
+    col = RectColumnSection(300, 500, 50, M20, Fe500, 0.0)
+    with pytest.raises(ValueError):
+        col.design_column(50e3, 900e6, charts=column_charts_M20)
+
+
+def test_column_charts_capacity_pure_bending(column_charts_M20):
+    # Curves start at pure bending, with Pu = 0 and Mu > 0 where there is steel
+    curves = np.asarray(column_charts_M20.curves)
+    assert np.all(curves[..., 0, 0] == 0.0)
+    assert np.all(curves[..., 1:, 0, 1] > 0.0)
+    assert np.all(curves[..., 0] >= 0.0)
+
+
+@pytest.mark.parametrize("Mu", [340e6, 370e6])
+def test_flanged_reqd_xu_tabulated_concrete(Fe500, Fe415, Mu):
+    bilinear = TabulatedConcrete(
+        20, [[0.0, 0.0], [0.00175, 0.446 * 20], [0.0035, 0.446 * 20]]
+    )
+    tsec = FlangedSection(
+        230.0, 450.0, 25.0, bilinear, Fe500, Fe500, Fe415, bf=900, df=150.0
+    )
+    xu = tsec.reqd_xu(Mu)
+    assert tsec.Mu(xu) == pytest.approx(Mu, rel=1e-9)
+    assert xu == pytest.approx(tsec.reqd_xu(Mu, method="brent"), rel=1e-9)
+
+
+def test_flanged_reqd_xu_at_Mulim(M20, Fe500, Fe415):
+    tsec = FlangedSection(
+        230.0, 450.0, 25.0, M20, Fe500, Fe500, Fe415, bf=900, df=150.0
+    )
+    xu = tsec.reqd_xu(tsec.Mulim)
+    assert tsec.df <= xu <= tsec.xumax
+    assert tsec.Mu(xu) == pytest.approx(tsec.Mulim, rel=1e-12)
+
+
+@pytest.mark.parametrize("min_length", [0.0, 500.0])
+def test_stirrup_zones_cover_stations(M20, Fe415, min_length):
+    beam = RectBeamSection(230, 450, 25, M20, Fe415, Fe415, Fe415)
+    x = np.linspace(0, 6000, 61)
+    Vu = 80 * (3000 - x)  # Uniform load 80 N/mm on a simply supported span
+    Ast = 1200.0
+    zones = beam.stirrup_zones(x, Vu, Ast, min_length=min_length)
+    assert zones[0].x1 == x[0] and zones[-1].x2 == x[-1]
+    assert all(z1.x2 == z2.x1 for z1, z2 in zip(zones[:-1], zones[1:]))
+
+    # Stirrups in every zone touching an interval between stations resist
+    # Vus at both its stations
+    Asv = 2 * np.pi * 8**2 / 4
+    Vus = np.abs(Vu) - beam.tau_c(Ast) * beam.b * beam.d
+    for i in range(len(x) - 1):
+        for z in zones:
+            if z.x1 < x[i + 1] and z.x2 > x[i]:
+                Vs = beam.vbars.fd * Asv * beam.d / z.sv
+                assert Vs >= Vus[i] and Vs >= Vus[i + 1]
+
+
+@pytest.mark.parametrize("method", ["closed", *SOLVERS])
+def test_flanged_reqd_xu_methods(M20, Fe500, Fe415, method):
+    tsec = FlangedSection(
+        230.0, 450.0, 25.0, M20, Fe500, Fe500, Fe415, bf=900, df=150.0
+    )
+    xu = tsec.reqd_xu(360e6, method=method)
+    assert tsec.Mu(xu) == pytest.approx(360e6, rel=1e-9)
+
+
+@pytest.mark.parametrize(
+    "charts, name",
+    [(design_charts, "design_charts.npz"), (column_charts, "column_charts")],
+)
+def test_charts_default_path(tmp_path, monkeypatch, charts, name):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+    charts.cache_clear()
+    try:
+        charts()
+    finally:
+        charts.cache_clear()
+    assert (tmp_path / "cache" / "rcd_bending_rect" / name).exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache"]
+
+
+def test_size_beam_missing_concrete_rate():
+    with pytest.raises(ValueError, match="fck=\\[15\\]"):
+        size_beam(150e6, 100e3, fck=(15, 20))
+
+
+def test_exact_backend_constants(Fe415):
+    with numeric_backend(NumericBackend.EXACT):
+        conc = Concrete(20)
+        assert conc.fd == Fraction(80, 9)
+        assert conc.k_pivot == Fraction(3, 7)
+        csb = conc.stress_block(Fraction(1))
+        assert csb.area(0, 1) == Fraction(17, 21)
+        assert csb.moment(0, 1) == Fraction(139, 294)
+        assert csb.centroid(0, 1) == Fraction(99, 238)
+        assert isinstance(conc.stress_block(Fraction(6, 5)).area(0, 1), Fraction)
+
+        # Irrational and float calculations are float, as documented
+        beam = RectBeamSection(230, 450, 25, conc, Fe415, Fe415, Fe415)
+        assert isinstance(beam.reqd_xu_d(100e6), float)
+    assert isinstance(Concrete(20).fd, float)
+
+
+@pytest.fixture(scope="module")
+def linear_concrete():
+    return TabulatedConcrete(20, [[0.0, 0.0], [0.0035, 0.446 * 20]])
+
+
+@pytest.mark.parametrize("Mu", [50e6, 100e6])
+def test_design_tabulated_concrete_by_strain_compatibility(linear_concrete, Fe415, Mu):
+    beam = RectBeamSection(230, 450, 25, linear_concrete, Fe415, Fe415, Fe415)
+    Asc, Ast = beam.Asc_Ast(Mu)
+    if Asc:
+        dia, y = np.sqrt(4 * np.array([Asc, Ast]) / np.pi), [beam.dc, beam.d]
+    else:
+        dia, y = np.sqrt(4 * Ast / np.pi), [beam.d]
+    result = beam.analyse(RebarLayers(dia, 1, y))
+    assert result.Mu == pytest.approx(Mu, rel=1e-6)
+    if not Asc:
+        xu = beam.reqd_xu_d(Mu) * beam.d
+        assert beam.Mu(xu) == pytest.approx(Mu, rel=1e-9)
+
+
+def test_xumax_uses_steel_offset(Fe415):
+    bilinear = TabulatedConcrete(
+        20, [[0.0, 0.0], [0.00175, 0.446 * 20], [0.0035, 0.446 * 20]]
+    )
+    beam = RectBeamSection(230, 450, 25, bilinear, Fe415, Fe415, Fe415)
+    assert beam.xumax_d() == pytest.approx(0.0035 / (0.0035 + Fe415.fd / 2e5 + 0.002))
+
+
+@pytest.mark.parametrize("df", [150.0, 250.0])  # xumax > df and xumax <= df
+@pytest.mark.parametrize("Mu", [60e6, 200e6])
+def test_flanged_reqd_xu_tabulated_in_flange(linear_concrete, Fe500, Fe415, df, Mu):
+    tsec = FlangedSection(
+        230.0, 450.0, 25.0, linear_concrete, Fe500, Fe500, Fe415, bf=900, df=df
+    )
+    xu = tsec.reqd_xu(Mu)
+    assert xu <= min(df, tsec.xumax)
+    assert tsec.Mu(xu) == pytest.approx(Mu, rel=1e-9)
+
+
+def test_interaction_curve_float_in_exact_backend(M20, Fe415):
+    col = RectColumnSection(300, 500, 50, M20, Fe415, 1800.0)
+    _, Pu_float, Mu_float = col.interaction_curve()
+    with numeric_backend(NumericBackend.EXACT):
+        col = RectColumnSection(300, 500, 50, Concrete(20), Fe415, 1800.0)
+        _, Pu, Mu = col.interaction_curve()
+    assert Pu.dtype == Mu.dtype == np.float64
+    assert Pu == pytest.approx(Pu_float, rel=1e-12)
+    assert Mu == pytest.approx(Mu_float, rel=1e-12)
+
+
+@pytest.mark.parametrize("Pu, Mu", [(1200e3, 100e6), (1500e3, 0.0), (500e3, 50e6)])
+def test_design_column_exact_backend(M20, Fe415, Pu, Mu):
+    ps_float = RectColumnSection(300, 500, 50, M20, Fe415, 0.0).design_column(Pu, Mu)
+    with numeric_backend(NumericBackend.EXACT):
+        col = RectColumnSection(300, 500, 50, Concrete(20), Fe415, 0.0)
+        ps = col.design_column(Pu, Mu)
+    assert ps == pytest.approx(ps_float, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("Mu, Vu", [(150e6, 100e3), (400e6, 250e3)])
+def test_size_beam_bars_fit_layout_table(Mu, Vu):
+    best = size_beam(Mu, Vu, cover=25)
+    table = bar_layout_table(best["b"], 25, (best["dia"],))
+    one_layer = (table.n2 == 0) & (table.m1 == 0)
+    assert best["nbars"] <= table.n1[one_layer].max()
+
+
+@pytest.mark.parametrize(
+    "conc", [Concrete(20), TabulatedConcrete(20, [[0.0, 0.0], [0.0035, 0.446 * 20]])]
+)
+@pytest.mark.parametrize("xu", [50.0, 120.0, 149.0, 151.0, 180.0])
+def test_dMu_dxu_matches_finite_difference(Fe500, Fe415, conc, xu):
+    beam = RectBeamSection(230, 450, 25, conc, Fe500, Fe500, Fe415)
+    tsec = FlangedSection(230, 450, 25, conc, Fe500, Fe500, Fe415, bf=900, df=150.0)
+    h = 1e-4
+    for sec in (beam, tsec):
+        fd = (sec.Mu(xu + h) - sec.Mu(xu - h)) / (2 * h)
+        assert sec.dMu_dxu(xu) == pytest.approx(fd, rel=1e-6)
+
+
+@pytest.fixture(scope="module")
+def beam_table():
+    # Singly reinforced, doubly reinforced, and concrete alone resisting Vu
+    return {
+        "b": np.array([230.0, 300.0, 230.0, 300.0]),
+        "D": np.array([450.0, 600.0, 450.0, 500.0]),
+        "cover": 25.0,
+        "fck": np.array([20.0, 25.0, 20.0, 30.0]),
+        "fy": np.array([415.0, 500.0, 500.0, 415.0]),
+        "Mu": np.array([100e6, 250e6, 220e6, 60e6]),
+        "Vu": np.array([100e3, 200e3, 150e3, 20e3]),
+    }
+
+
+def test_design_beams_matches_rect_beam_section(beam_table):
+    result = design_beams(beam_table)
+    for i in range(len(beam_table["b"])):
+        bars = RebarHYSD(beam_table["fy"][i])
+        beam = RectBeamSection(
+            beam_table["b"][i],
+            beam_table["D"][i],
+            beam_table["cover"],
+            Concrete(beam_table["fck"][i]),
+            bars,
+            bars,
+            bars,
+            vbar_dia=8,
+        )
+        Mu, Vu = beam_table["Mu"][i], beam_table["Vu"][i]
+        Asc, Ast = beam.design_bending(Mu, Vu)
+        sv = beam.design_shear(
+            Vu, 0.0, Ast, ShearReinforcementType.VERTICAL_STIRRUP, 2, 8
+        )
+        if sv < 0:  # Concrete alone resists Vu
+            stirrups = Stirrups(
+                bars, 2, 8, 90.0, ShearReinforcementType.VERTICAL_STIRRUP
+            )
+            sv = stirrups.sv_max(beam.b, beam.d)
+        assert result["d"][i] == beam.d
+        assert result["Mulim"][i] == pytest.approx(beam.Mulim, rel=1e-12)
+        assert result["Asc"][i] == pytest.approx(Asc, rel=1e-12)
+        assert result["Ast"][i] == pytest.approx(Ast, rel=1e-12)
+        assert result["tau_c"][i] == pytest.approx(beam.tau_c(Ast), rel=1e-12)
+        assert result["sv"][i] == pytest.approx(sv, rel=1e-12)
+    assert result["Asc"][2] > 0
+
+
+def test_design_beams_shear_exceeds_tau_cmax(beam_table):
+    table = dict(beam_table, Vu=np.array([100e3, 200e3, 600e3, 20e3]))
+    result = design_beams(table)
+    assert np.isnan(result["sv"][2])
+    assert not np.isnan(np.delete(result["sv"], 2)).any()
+
+
+def test_design_beams_missing_column(beam_table):
+    table = {name: col for name, col in beam_table.items() if name != "Mu"}
+    with pytest.raises(ValueError, match="Mu"):
+        design_beams(table)
+
+
+def test_design_beams_dataframe(beam_table):
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(beam_table)
+    result = design_beams(df)
+    assert list(result.columns[: len(df.columns)]) == list(df.columns)
+    assert result["Ast"].to_numpy() == pytest.approx(design_beams(beam_table)["Ast"])
+
+
+def test_design_flanged_beams_matches_flanged_section(Fe500):
+    # NA in the flange, NA below the flange, doubly reinforced L-beam
+    table = {
+        "bw": np.array([230.0, 230.0, 230.0]),
+        "D": np.array([450.0, 450.0, 450.0]),
+        "df": np.array([120.0, 100.0, 100.0]),
+        "l0": np.array([6000.0, 5000.0, 5000.0]),
+        "spacing": 3000.0,
+        "L_beam": np.array([0.0, 1.0, 1.0]),
+        "cover": 25.0,
+        "fck": 20.0,
+        "fy": 500.0,
+        "Mu": np.array([150e6, 300e6, 400e6]),
+        "Vu": 100e3,
+    }
+    result = design_flanged_beams(table)
+    for i in range(3):
+        bw, df, L_beam = table["bw"][i], table["df"][i], bool(table["L_beam"][i])
+        bf = effective_flange_width(table["l0"][i], bw, df, 3000.0, L_beam)
+        tsec = FlangedSection(
+            bw, 450.0, 25.0, Concrete(20), Fe500, Fe500, Fe500, bf=bf, df=df
+        )
+        Asc, Ast = tsec.Asc_Ast(table["Mu"][i])
+        assert result["bf"][i] == bf
+        assert result["Mulim"][i] == pytest.approx(tsec.Mulim, rel=1e-12)
+        assert result["Asc"][i] == pytest.approx(Asc, rel=1e-9, abs=1e-9)
+        assert result["Ast"][i] == pytest.approx(Ast, rel=1e-9)
+    assert result["xu"][0] < table["df"][0] < result["xu"][1]
+    assert result["Asc"][2] > 0
+
+
+def test_effective_flange_width():
+    # IS456 23.1.2 for T-beams, l0 / 6 + bw + 6 df, and L-beams,
+    # l0 / 12 + bw + 3 df, each limited by the actual width of flange
+    assert effective_flange_width(6000.0, 230.0, 120.0, 3000.0) == 1950.0
+    assert effective_flange_width(6000.0, 230.0, 120.0, 1500.0) == 1500.0
+    assert effective_flange_width(6000.0, 230.0, 120.0, 3000.0, True) == 1090.0
+    assert effective_flange_width(6000.0, 230.0, 120.0, 1500.0, True) == 865.0
+    bf = effective_flange_width(6000.0, 230.0, 120.0, 3000.0, np.array([False, True]))
+    assert bf.tolist() == [1950.0, 1090.0]
+
+
+def test_bar_layout_table_layouts_fit():
+    table = bar_layout_table(300.0, 25.0, (12, 16, 20, 25))
+    w = 300.0 - 2 * 25.0
+    nbars1 = table.n1 + table.m1
+    assert np.all(table.n1 >= 2)
+    assert np.all(
+        (w - table.n1 * table.dia1 - table.m1 * table.dia1b) / (nbars1 - 1)
+        >= np.maximum(table.dia1, 25.0)
+    )
+    two = table.n2 > 0
+    assert np.all(table.n2[two] <= nbars1[two])
+    assert np.all(table.dia2[two] <= table.dia1[two])
+    assert np.all((w - table.n2[two] * table.dia2[two]) / (table.n2[two] - 1) >= 25.0)
+
+    area = (
+        np.pi
+        / 4
+        * (
+            table.n1 * table.dia1**2
+            + table.m1 * table.dia1b**2
+            + table.n2 * table.dia2**2
+        )
+    )
+    assert table.area == pytest.approx(area, rel=1e-12)
+    assert np.all(np.diff(table.area) >= 0)
+    # A single layer of 2-#20 has its centroid at the centre of the bars
+    (i,) = np.flatnonzero((table.n1 == 2) & (table.dia1 == 20) & (table.m1 == 0) & ~two)
+    assert table.y[i] == 25.0 + 10.0
+
+
+def test_bar_layout_table_lookup():
+    table = bar_layout_table(300.0, 25.0, (12, 16, 20, 25))
+    for Ast in (300.0, 1000.0, 2500.0):
+        layout = table.lookup(Ast, tol=0.05)
+        least = table.area[np.searchsorted(table.area, Ast)]
+        assert Ast <= layout.area <= least * 1.05
+        nbars = sum(n for layer in layout.layers for n, _ in layer)
+        near = (table.area >= Ast) & (table.area <= least * 1.05)
+        assert nbars == (table.n1 + table.m1 + table.n2)[near].min()
+    with pytest.raises(ValueError):
+        table.lookup(1e6)
+
+
+def test_arrange_tbars(M20, Fe500, Fe415):
+    beam = RectBeamSection(300, 500, 25, M20, Fe500, Fe500, Fe415)
+    layout = beam.arrange_tbars(200e6)
+    assert beam.tbar_layout is layout
+    assert beam.d == 500 - layout.y
+    # The layout provides the Ast required at the d that it gives
+    assert layout.area >= beam.Asc_Ast(200e6)[1]
+
+
+@pytest.mark.parametrize("Mu", [80e6, 150e6, 250e6])
+def test_analyse_reproduces_design(M20, Fe415, Mu):
+    beam = RectBeamSection(230, 450, 25, M20, Fe415, Fe415, Fe415)
+    Asc, Ast = beam.Asc_Ast(Mu)
+    dia = np.sqrt(4 * np.array([Asc, Ast]) / np.pi)
+    result = beam.analyse(RebarLayers(dia, 1, [beam.dc, -(beam.D - beam.d)]))
+    assert result.Mu == pytest.approx(Mu, rel=1e-6)
+    assert result.C + result.Fs.sum() == pytest.approx(0.0, abs=1e-6 * Mu / beam.d)
+    if Asc:
+        assert result.xu == pytest.approx(beam.xumax, rel=1e-6)
+    else:
+        assert result.xu == pytest.approx(beam.reqd_xu_d(Mu) * beam.d, rel=1e-6)
+        assert result.fs[1] == pytest.approx(-Fe415.fd)
+
+
+def test_analyse_layers_are_additive(M20, Fe500, Fe415):
+    # Two layers at the same depth act as one layer of their combined area
+    beam = RectBeamSection(230, 450, 25, M20, Fe500, Fe500, Fe415)
+    one = beam.analyse(RebarLayers([20], 4, 415))
+    two = beam.analyse(RebarLayers(20, [1, 3], [415, -35]))
+    assert two.xu == pytest.approx(one.xu, rel=1e-9)
+    assert two.Mu == pytest.approx(one.Mu, rel=1e-9)
+    assert two.Fs.sum() == pytest.approx(one.Fs.sum(), rel=1e-9)
+
+
+@pytest.mark.parametrize(
+    "material, law",
+    [
+        (Concrete(20), "fc"),
+        (RebarMS(250), "fs"),
+        (RebarHYSD(415), "fs"),
+        (RebarHYSD(500), "fs"),
+    ],
+)
+def test_material_laws_accept_arrays(material, law):
+    es = np.linspace(-0.006, 0.006, 240)
+    stress = getattr(material, law)
+    fs = stress(es.reshape(3, -1))
+    assert fs.shape == (3, 80)
+    assert fs.ravel() == pytest.approx(
+        [stress(float(e)) for e in es], rel=1e-12, abs=1e-12
+    )
+
+
+def test_hysd_curve_shared_per_grade():
+    bars1, bars2 = RebarHYSD(415), RebarHYSD(415)
+    assert bars1.curve is bars2.curve is hysd_curve(415, 2e5)
+    assert RebarHYSD(500).curve is not bars1.curve
+    assert not bars1.es_fs.flags.writeable
+    # Points of the design curve of IS456 Fig. 23A
+    assert bars1.es_fs[-1].tolist() == pytest.approx([bars1.fd / 2e5 + 0.002, bars1.fd])
+    assert bars1.curve.es == tuple(bars1.es_fs[:, 0])
+
+
+def test_tau_c_is456_arrays():
+    pt = np.array([0.15, 0.5, 1.0, 2.0, 3.0])
+    fck = np.array([[20.0], [25.0], [30.0]])
+    tau_c = tau_c_is456(pt, fck)
+    assert tau_c.shape == (3, 5)
+    expected = [[tau_c_is456(float(p), float(f)) for p in pt] for f in fck[:, 0]]
+    assert tau_c == pytest.approx(np.array(expected), rel=1e-12)
+    # IS456 Table 19, M20
+    assert tau_c[0] == pytest.approx([0.28, 0.48, 0.62, 0.79, 0.82], abs=0.01)
+    # Solid slabs, Cl. 40.2.1.1
+    assert tau_c_is456(pt, 20.0, D=150.0) == pytest.approx(1.3 * tau_c[0])
+    assert slab_k_is456(np.array([100.0, 212.5, 400.0])) == pytest.approx(
+        [1.3, 1.175, 1.0]
+    )
+
+
+def test_tau_cmax_is456():
+    fck = np.array([15.0, 20.0, 25.0, 30.0, 35.0, 40.0, 50.0])
+    assert tau_cmax_is456(fck).tolist() == [2.5, 2.8, 3.1, 3.5, 3.7, 4.0, 4.0]
+    assert tau_cmax_is456(20.0, slab=True) == 1.4
+    assert tau_cmax_is456(fck, np.array([True] + [False] * 6))[0] == 1.25
+
+
+def test_csb_integrals_match_csb():
+    k = np.array([0.2, 0.5, 0.9, 1.0, 1.2, 2.0])[:, None]
+    z = np.array([0.0, 0.1, 0.3, 0.6])
+    area, moment, centroid = csb_integrals(k, z, k)
+    assert area.shape == moment.shape == centroid.shape == (6, 4)
+    for i, ki in enumerate(k[:, 0]):
+        csb = CSB(ki)
+        for j, zj in enumerate(z):
+            assert area[i, j] == pytest.approx(csb.area(zj, ki), rel=1e-12)
+            assert moment[i, j] == pytest.approx(csb.moment(zj, ki), rel=1e-12)
+            assert centroid[i, j] == pytest.approx(csb.centroid(zj, ki), rel=1e-12)
+    # Empty blocks have no centroid
+    assert np.isnan(csb_integrals(0.5, 0.5, 0.5)[2])
+    with pytest.raises(ValueError):
+        csb_integrals(np.array([0.5, -0.1]), 0.0, 0.5)
+
+
+def test_derived_properties_cached_until_field_changes(M20, Fe415, Fe500):
+    beam = RectBeamSection(230, 450, 25, M20, Fe415, Fe415, Fe415)
+    Mulim = beam.Mulim
+    assert beam.Mulim is Mulim
+    assert beam.d == 450 - 25 - 10
+
+    beam.D = 500
+    assert beam.d == 500 - 25 - 10
+    assert beam.Mulim > Mulim
+    beam.tbars = Fe500
+    assert beam.xumax == pytest.approx(
+        0.0035 / (0.0035 + Fe500.fd / 2e5 + 0.002) * beam.d
+    )
+    assert beam.Mulim == pytest.approx(
+        RectBeamSection(230, 500, 25, M20, Fe500, Fe415, Fe415).Mulim, rel=1e-15
+    )
+
+
+def test_design_charts(tmp_path, M20, Fe415):
+    charts = DesignCharts.generate(fck=(20, 25), fy=(415, 500), n=101)
+    assert charts.check(n=20) < 1e-3
+    charts.save(tmp_path / "charts.npz")
+    loaded = DesignCharts.load(tmp_path / "charts.npz")
+    assert np.array_equal(loaded.Mu_bd2, charts.Mu_bd2)
+
+    beam = RectBeamSection(230, 450, 25, M20, Fe415, Fe415, Fe415)
+    bd2 = beam.b * beam.d**2
+    assert loaded.Mulim_bd2(20, 415) == pytest.approx(beam.Mulim / bd2, rel=1e-12)
+    pt = loaded.reqd_pt(20, 415, np.array([1.0, 2.0, 3.0]))
+    assert pt[:2] * beam.b * beam.d / 100 == pytest.approx(
+        [beam.reqd_Ast(Mu_bd2 * bd2) for Mu_bd2 in (1.0, 2.0)], rel=1e-3
+    )
+    assert np.isnan(pt[2])  # Beyond Mulim / (b d^2) = 2.76
+    assert loaded.Mu_bd2_pt(20, 415, pt[:2]) == pytest.approx([1.0, 2.0])
+    with pytest.raises(ValueError):
+        loaded.chart(30, 415)
+
+
+@pytest.mark.parametrize("steel", [RebarHYSD(415), RebarMS(250)])
+def test_interaction_curve_matches_Pu_Mu(M20, steel):
+    col = RectColumnSection(300, 500, 50, M20, steel, 1800.0)
+    xu, Pu, Mu = col.interaction_curve(n_points=40)
+    assert xu.size == Pu.size == Mu.size == 40
+    for i in range(xu.size - 1):
+        Pu_i, Mu_i, _ = col.Pu_Mu(float(xu[i]))
+        assert Pu[i] == pytest.approx(Pu_i, rel=1e-9)
+        assert Mu[i] == pytest.approx(Mu_i, rel=1e-9, abs=1e-3)
+    assert (xu[-1], Pu[-1], Mu[-1]) == (np.inf, col.Pu0(), 0.0)
+    assert np.all(np.diff(Pu) > 0)
+
+
+@pytest.mark.parametrize("Pu, Mu", [(1200e3, 100e6), (500e3, 150e6), (2500e3, 50e6)])
+def test_design_column_newton_satisfies_Pu_Mu(M20, Fe415, Pu, Mu):
+    col = RectColumnSection(300, 500, 50, M20, Fe415, 0.0)
+    stats = SolverStats()
+    xu, ps = col.design_column_newton(Pu, Mu, stats=stats)
+    assert ps > 0
+    assert col.total_As == pytest.approx(ps / 100 * col.b * col.D)
+    Pu_xu, Mu_xu, _ = col.Pu_Mu(xu)
+    assert Pu_xu == pytest.approx(Pu, rel=1e-8)
+    assert Mu_xu == pytest.approx(Mu, rel=1e-8)
+    assert stats.niter < 20
+
+
+def test_design_column_newton_concrete_alone(M20, Fe415):
+    col = RectColumnSection(300, 500, 50, M20, Fe415, 0.0)
+    stats = SolverStats()
+    _, ps = col.design_column_newton(300e3, 10e6, stats=stats)
+    assert ps == 0.0
+    assert stats.reason == "bound"